@@ -9,20 +9,24 @@ Usage:
     python examples/test_local.py
 """
 
+import asyncio
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from examples.test_objects import (
     admin_registration_payload,
     login_payload,
-    user_registration_payload,
+    make_credentials,
 )
 from keyrunes_sdk import (
+    AsyncKeyrunesClient,
     AuthenticationError,
     AuthorizationError,
     KeyrunesClient,
+    Token,
     require_admin,
     require_group,
 )
@@ -33,48 +37,57 @@ ADMIN_KEY = os.getenv("ADMIN_KEY", "dev_admin_key_change_in_production")
 ORG_KEY = os.getenv("KEYRUNES_ORG_KEY")
 
 
+_RULE = b"=" * 60
+
+
+def _write(prefix: bytes, message: str) -> None:
+    """Write one pre-encoded line to stdout with a single write call."""
+    stream = sys.stdout.buffer
+    stream.write(prefix + message.encode("utf-8") + b"\n")
+    stream.flush()
+
+
 def print_section(title: str) -> None:
     """Print section header."""
-    print(f"\n{'=' * 60}")
-    print(f"  {title}")
-    print(f"{'=' * 60}\n")
+    _write(b"\n" + _RULE + b"\n  ", f"{title}\n{'=' * 60}\n")
 
 
 def print_success(message: str) -> None:
     """Print success message."""
-    print(f"[OK] {message}")
+    _write(b"[OK] ", message)
 
 
 def print_error(message: str) -> None:
     """Print error message."""
-    print(f"[ERROR] {message}")
+    _write(b"[ERROR] ", message)
 
 
 def print_info(message: str) -> None:
     """Print info message."""
-    print(f"[INFO] {message}")
+    _write(b"[INFO] ", message)
 
 
 def wait_for_keyrunes(url: str, timeout: int = 30) -> bool:
     """Wait for Keyrunes to be available."""
-    from urllib.parse import urljoin
-
     import httpx
 
-    health_url = urljoin(url.rstrip("/") + "/", "api/health")
+    health_url = f"{url.rstrip('/')}/api/health"
     print_info(f"Waiting for Keyrunes health at {health_url}...")
 
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        try:
-            with httpx.Client(timeout=2) as client:
+    delay = 0.1
+    start_time = time.monotonic()
+    with httpx.Client(timeout=2) as client:
+        while time.monotonic() - start_time < timeout:
+            try:
                 response = client.get(health_url)
-            if response.status_code == 200:
-                print_success("Keyrunes is available!")
-                return True
-        except httpx.RequestError:
-            time.sleep(2)
-            print(".", end="", flush=True)
+                if response.status_code == 200:
+                    print_success("Keyrunes is available!")
+                    return True
+            except httpx.RequestError:
+                sys.stdout.buffer.write(b".")
+                sys.stdout.buffer.flush()
+            time.sleep(delay)
+            delay = min(delay * 2, 2.0)
 
     print_error(f"Timeout: Keyrunes did not respond after {timeout}s")
     return False
@@ -85,7 +98,7 @@ def test_user_registration(client: KeyrunesClient) -> Optional[tuple]:
     print_section("Test 1: User Registration")
 
     try:
-        user_data = user_registration_payload()
+        user_data, login_data = make_credentials()
         user = client.register_user(**user_data, namespace="public")
 
         print_success(f"User registered: {user.username} ({user.email})")
@@ -93,21 +106,20 @@ def test_user_registration(client: KeyrunesClient) -> Optional[tuple]:
         print_info(f"Groups: {user.groups}")
         print_info(f"Attributes: {user.attributes}")
 
-        return (user.id, user_data)
+        return (user.id, user_data, login_data)
 
     except Exception as e:
         print_error(f"Failed to register user: {e}")
         return None
 
 
-def test_user_login(client: KeyrunesClient, user_data: dict) -> bool:
+def test_user_login(
+    client: KeyrunesClient, user_data: dict, login_data: dict
+) -> bool:
     """Test user login."""
     print_section("Test 2: User Login")
 
     try:
-        login_data = login_payload(
-            email=user_data["email"], password=user_data["password"]
-        )
         token = client.login(
             user_data["username"], login_data["password"], namespace="public"
         )
@@ -172,11 +184,9 @@ def test_group_check(client: KeyrunesClient, user_id: str) -> None:
     print_section("Test 5: Group Verification")
 
     try:
-        has_users_group = client.has_group(user_id, "users")
-        print_success(f"User has 'users' group: {has_users_group}")
-
-        has_admin_group = client.has_group(user_id, "admins")
-        print_success(f"User has 'admins' group: {has_admin_group}")
+        memberships = client.has_groups(user_id, ["users", "admins"])
+        print_success(f"User has 'users' group: {memberships['users']}")
+        print_success(f"User has 'admins' group: {memberships['admins']}")
 
     except Exception as e:
         print_error(f"Failed to verify groups: {e}")
@@ -244,14 +254,38 @@ def test_get_user_groups(client: KeyrunesClient) -> None:
         print_error(f"Failed to get groups: {e}")
 
 
-def test_context_manager(user_data: dict) -> None:
+async def test_concurrent_lookups(token: Token, user_id: str) -> None:
+    """Test that lookups on different endpoints run concurrently."""
+    print_section("Test 9: Concurrent Lookups (AsyncKeyrunesClient)")
+
+    try:
+        async with AsyncKeyrunesClient(
+            base_url=KEYRUNES_URL, organization_key=ORG_KEY
+        ) as client:
+            client.set_token(token.access_token)
+            # The user profile and each group check are separate requests
+            # (/api/users/{id} and /api/users/{id}/groups/{group}), so
+            # gathering them overlaps three distinct round-trips.
+            user, has_users_group, has_admin_group = await asyncio.gather(
+                client.get_user(user_id),
+                client.has_group(user_id, "users"),
+                client.has_group(user_id, "admins"),
+            )
+
+        print_success(f"User retrieved: {user.username}")
+        print_info(f"Email: {user.email}")
+        print_success(f"User has 'users' group: {has_users_group}")
+        print_success(f"User has 'admins' group: {has_admin_group}")
+
+    except Exception as e:
+        print_error(f"Failed to run concurrent lookups: {e}")
+
+
+def test_context_manager(login_data: dict) -> None:
     """Test using client as context manager."""
-    print_section("Test 9: Context Manager")
+    print_section("Test 10: Context Manager")
 
     try:
-        login_data = login_payload(
-            email=user_data["email"], password=user_data["password"]
-        )
         with KeyrunesClient(base_url=KEYRUNES_URL) as client:
             token = client.login(
                 login_data["identity"],
@@ -278,34 +312,45 @@ def main() -> int:
         return 1
 
     client = KeyrunesClient(base_url=KEYRUNES_URL, organization_key=ORG_KEY)
-
-    user_result = test_user_registration(client)
-    if not user_result:
-        print_error("\nCannot continue without user_id")
-        return 1
-    user_id, user_data = user_result
-
-    if not test_user_login(client, user_data):
-        print_error("\nCannot continue without login")
-        return 1
-
-    admin_result = test_admin_registration(client)
-    if not admin_result:
-        print_error("\nCannot continue without admin_id")
-        return 1
-    admin_id, admin_data = admin_result
-
     admin_client = KeyrunesClient(
         base_url=KEYRUNES_URL, organization_key=ORG_KEY
     )
-    admin_login_data = login_payload(
-        email=admin_data["email"], password=admin_data["password"]
-    )
-    admin_client.login(
-        admin_login_data["identity"],
-        admin_login_data["password"],
-        namespace="public",
-    )
+
+    # Registrations and logins are independent round-trips, so run them
+    # concurrently over the clients' pooled connections.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        user_future = executor.submit(test_user_registration, client)
+        admin_future = executor.submit(test_admin_registration, client)
+        user_result = user_future.result()
+        admin_result = admin_future.result()
+
+        if not user_result:
+            print_error("\nCannot continue without user_id")
+            return 1
+        user_id, user_data, login_data = user_result
+
+        if not admin_result:
+            print_error("\nCannot continue without admin_id")
+            return 1
+        admin_id, admin_data = admin_result
+
+        admin_login_data = login_payload(
+            email=admin_data["email"], password=admin_data["password"]
+        )
+        login_future = executor.submit(
+            test_user_login, client, user_data, login_data
+        )
+        admin_login_future = executor.submit(
+            admin_client.login,
+            admin_login_data["identity"],
+            admin_login_data["password"],
+            namespace="public",
+        )
+
+        if not login_future.result():
+            print_error("\nCannot continue without login")
+            return 1
+        admin_token = admin_login_future.result()
 
     if admin_client._token_data:
         admin_groups = admin_client._token_data.get("groups", [])
@@ -330,7 +375,8 @@ def main() -> int:
     test_decorator_require_group(client, user_id)
     test_decorator_require_admin(admin_client, admin_id, user_id)
     test_get_user_groups(client)
-    test_context_manager(user_data)
+    asyncio.run(test_concurrent_lookups(admin_token, user_id))
+    test_context_manager(login_data)
 
     print_section("Tests Completed!")
     print_success("All tests were executed")
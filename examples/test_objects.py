@@ -1,16 +1,18 @@
 import os
 import secrets
 import string
-from uuid import uuid4
+
+# 64 symbols so that ``byte & 63`` maps random bytes onto it without bias.
+_ALPHABET_64 = string.ascii_letters + string.digits + "!@"
 
 
 def _suffix(value: str | None = None) -> str:
-    return value or uuid4().hex[:6]
+    return value or secrets.token_hex(3)
 
 
 def _random_password(length: int = 12) -> str:
-    alphabet = string.ascii_letters + string.digits + "!@#$%^&*"
-    return "".join(secrets.choice(alphabet) for _ in range(length))
+    raw = secrets.token_bytes(length)
+    return "".join([_ALPHABET_64[b & 63] for b in raw])
 
 
 def user_registration_payload(
@@ -45,8 +47,17 @@ def login_payload(email: str, password: str) -> dict:
     return {"identity": email, "password": password}
 
 
+def make_credentials(
+    suffix: str | None = None, password: str | None = None
+) -> tuple[dict, dict]:
+    registration = user_registration_payload(suffix, password)
+    login = login_payload(registration["email"], registration["password"])
+    return registration, login
+
+
 __all__ = [
     "user_registration_payload",
     "admin_registration_payload",
     "login_payload",
+    "make_credentials",
 ]
@@ -1,35 +1,67 @@
 """Keyrunes SDK - Python client for Keyrunes Authorization System."""
 
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
 __version__ = "0.1.0"
 
-from keyrunes_sdk.client import KeyrunesClient
-from keyrunes_sdk.config import (
-    clear_global_client,
-    configure,
-    get_config,
-    get_global_client,
-)
-from keyrunes_sdk.decorators import require_admin, require_group
-from keyrunes_sdk.exceptions import (
-    AuthenticationError,
-    AuthorizationError,
-    GroupNotFoundError,
-    KeyrunesError,
-    NetworkError,
-    UserNotFoundError,
-)
-from keyrunes_sdk.models import (
-    AdminRegistration,
-    Group,
-    GroupCheck,
-    LoginCredentials,
-    Token,
-    User,
-    UserRegistration,
-)
+if TYPE_CHECKING:
+    from keyrunes_sdk.async_client import AsyncKeyrunesClient
+    from keyrunes_sdk.client import KeyrunesClient
+    from keyrunes_sdk.config import (
+        clear_global_client,
+        configure,
+        get_config,
+        get_global_client,
+    )
+    from keyrunes_sdk.decorators import require_admin, require_group
+    from keyrunes_sdk.exceptions import (
+        AuthenticationError,
+        AuthorizationError,
+        GroupNotFoundError,
+        KeyrunesError,
+        NetworkError,
+        UserNotFoundError,
+    )
+    from keyrunes_sdk.models import (
+        AdminRegistration,
+        Group,
+        GroupCheck,
+        LoginCredentials,
+        Token,
+        User,
+        UserRegistration,
+    )
+
+# Public names are resolved on first access (PEP 562) so that importing the
+# package does not pull in httpx/pydantic until they are actually needed.
+_LAZY_IMPORTS: Dict[str, str] = {
+    "KeyrunesClient": "keyrunes_sdk.client",
+    "AsyncKeyrunesClient": "keyrunes_sdk.async_client",
+    "configure": "keyrunes_sdk.config",
+    "get_global_client": "keyrunes_sdk.config",
+    "clear_global_client": "keyrunes_sdk.config",
+    "get_config": "keyrunes_sdk.config",
+    "require_group": "keyrunes_sdk.decorators",
+    "require_admin": "keyrunes_sdk.decorators",
+    "KeyrunesError": "keyrunes_sdk.exceptions",
+    "AuthenticationError": "keyrunes_sdk.exceptions",
+    "AuthorizationError": "keyrunes_sdk.exceptions",
+    "GroupNotFoundError": "keyrunes_sdk.exceptions",
+    "UserNotFoundError": "keyrunes_sdk.exceptions",
+    "NetworkError": "keyrunes_sdk.exceptions",
+    "User": "keyrunes_sdk.models",
+    "Group": "keyrunes_sdk.models",
+    "Token": "keyrunes_sdk.models",
+    "UserRegistration": "keyrunes_sdk.models",
+    "AdminRegistration": "keyrunes_sdk.models",
+    "LoginCredentials": "keyrunes_sdk.models",
+    "GroupCheck": "keyrunes_sdk.models",
+}
 
 __all__ = [
     "KeyrunesClient",
+    "AsyncKeyrunesClient",
     "configure",
     "get_global_client",
     "clear_global_client",
@@ -50,3 +82,27 @@ __all__ = [
     "LoginCredentials",
     "GroupCheck",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public SDK names and submodules lazily on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        # Keep ``keyrunes_sdk.config`` etc. working without an explicit
+        # submodule import, as they did before names became lazy.
+        submodule = f"{__name__}.{name}"
+        try:
+            return importlib.import_module(submodule)
+        except ModuleNotFoundError as error:
+            if error.name != submodule:
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes including lazily imported names."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,25 @@
+"""JSON encoding helpers, using orjson when it is installed."""
+
+from typing import Any
+
+try:
+    import orjson
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to compact JSON bytes."""
+        return orjson.dumps(obj)
+
+    def loads(data: bytes) -> Any:
+        """Deserialize JSON bytes."""
+        return orjson.loads(data)
+
+except ImportError:
+    import json
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to compact JSON bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def loads(data: bytes) -> Any:
+        """Deserialize JSON bytes."""
+        return json.loads(data)
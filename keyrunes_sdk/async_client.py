@@ -0,0 +1,313 @@
+"""Asynchronous Keyrunes API Client."""
+
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from keyrunes_sdk.client import DEFAULT_GROUP_CACHE_TTL, BaseKeyrunesClient
+from keyrunes_sdk.exceptions import (
+    GroupNotFoundError,
+    NetworkError,
+    UserNotFoundError,
+)
+from keyrunes_sdk.models import (
+    AdminRegistration,
+    GroupCheck,
+    Token,
+    User,
+    UserRegistration,
+)
+
+
+class AsyncKeyrunesClient(BaseKeyrunesClient):
+    """
+    Asynchronous client for interacting with Keyrunes Authorization System.
+
+    Mirrors the ``KeyrunesClient`` API, but every network-bound method is a
+    coroutine backed by a pooled ``httpx.AsyncClient``. Independent lookups
+    can therefore be awaited concurrently (e.g. with ``asyncio.gather``) so
+    their round-trips overlap instead of adding up.
+
+    Args:
+        base_url: Base URL of the Keyrunes API
+            (e.g., "https://keyrunes.example.com")
+        api_key: Optional API key for authentication
+        organization_key: Optional Organization Key (required for v0.2.0+)
+            If not provided, looks for KEYRUNES_ORG_KEY env var
+        timeout: Request timeout in seconds; connecting is capped at
+            DEFAULT_CONNECT_TIMEOUT (5 s) when this is larger (default: 30)
+        limits: Connection pool limits for the underlying HTTP client
+            (default: DEFAULT_LIMITS)
+        http2: Whether to negotiate HTTP/2 with the server; requires the
+            ``httpx[http2]`` extra to be installed (default: False)
+        group_cache_ttl: Seconds a group membership result is cached, so a
+            revoked membership is honoured only after it expires; 0 disables
+            the cache (default: 0)
+        transport: Optional httpx async transport to send requests through
+            instead of the default pooled one; ``limits``, ``http2`` and
+            environment proxies are ignored when given
+
+    Example:
+        >>> async with AsyncKeyrunesClient(
+        ...     "https://keyrunes.example.com"
+        ... ) as client:
+        ...     await client.login("user@example.com", "password123")
+        ...     me, groups = await asyncio.gather(
+        ...         client.get_current_user(),
+        ...         client.get_user_groups(),
+        ...     )
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        organization_key: Optional[str] = None,
+        timeout: int = 30,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        group_cache_ttl: float = DEFAULT_GROUP_CACHE_TTL,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        """Initialize asynchronous Keyrunes client."""
+        super().__init__(
+            base_url=base_url,
+            api_key=api_key,
+            organization_key=organization_key,
+            timeout=timeout,
+            group_cache_ttl=group_cache_ttl,
+        )
+        if transport is None:
+            pool_options = self._pool_options(limits, http2)
+        else:
+            pool_options = {"transport": transport}
+        self._client = httpx.AsyncClient(**pool_options, **self._http_options())
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        use_auth: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Make HTTP request to Keyrunes API.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint, relative to ``base_url``
+            data: Request body data
+            params: Query parameters
+            use_auth: Whether to include authentication header
+
+        Returns:
+            Response JSON data
+
+        Raises:
+            NetworkError: If request fails
+            AuthenticationError: If authentication fails (401)
+            AuthorizationError: If authorization fails (403)
+        """
+        try:
+            response = await self._client.request(
+                method=method,
+                url=endpoint,
+                **self._request_options(data, params, use_auth),
+            )
+            return self._handle_response(response)
+
+        except httpx.RequestError as e:
+            raise NetworkError(f"Network request failed: {str(e)}")
+
+    async def login(
+        self, username: str, password: str, namespace: str = "public"
+    ) -> Token:
+        """
+        Authenticate user and obtain access token.
+
+        See ``KeyrunesClient.login``.
+        """
+        credentials = self._login_credentials(username, password, namespace)
+        response = await self._make_request(
+            "POST",
+            "/api/login",
+            data=credentials.model_dump(),
+            use_auth=False,
+        )
+
+        token = self._parse_token_response(response)
+        self.set_token(token.access_token)
+        self._remember_login_user(token)
+        return token
+
+    async def register_user(
+        self,
+        username: str,
+        email: str,
+        password: str,
+        namespace: str = "public",
+        **attributes: Any,
+    ) -> User:
+        """
+        Register a new user.
+
+        See ``KeyrunesClient.register_user``.
+        """
+        registration = UserRegistration(
+            username=username,
+            email=email,
+            password=password,
+            namespace=namespace,
+            attributes=attributes,
+        )
+        response = await self._make_request(
+            "POST",
+            "/api/register",
+            data=registration.model_dump(),
+            use_auth=False,
+        )
+
+        return self._registered_user(response, "user")
+
+    async def register_admin(
+        self,
+        username: str,
+        email: str,
+        password: str,
+        admin_key: str,
+        namespace: str = "public",
+        **attributes: Any,
+    ) -> User:
+        """
+        Register a new admin user.
+
+        See ``KeyrunesClient.register_admin``.
+        """
+        registration = AdminRegistration(
+            username=username,
+            email=email,
+            password=password,
+            admin_key=admin_key,
+            namespace=namespace,
+            attributes=attributes,
+        )
+        response = await self._make_request(
+            "POST",
+            "/api/register",
+            data=registration.model_dump(),
+            use_auth=False,
+        )
+
+        return self._registered_user(response, "admin")
+
+    async def has_group(self, user_id: str, group_id: str) -> bool:
+        """
+        Check if a user belongs to a specific group.
+
+        See ``KeyrunesClient.has_group``.
+        """
+        self._require_token()
+
+        if self._is_token_user(user_id):
+            return group_id in self._token_groups()
+
+        cache_key = (str(user_id), group_id)
+        cached = self._group_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            response = await self._make_request(
+                "GET",
+                f"/api/users/{user_id}/groups/{group_id}",
+            )
+            check = GroupCheck(**response)
+            self._group_cache.set(cache_key, check.has_access)
+            return check.has_access
+        except UserNotFoundError:
+            raise GroupNotFoundError(
+                f"Group '{group_id}' not found or user not in group"
+            )
+
+    async def has_groups(
+        self, user_id: str, group_ids: List[str]
+    ) -> Dict[str, bool]:
+        """
+        Check membership of a user in several groups with a single lookup.
+
+        See ``KeyrunesClient.has_groups``.
+        """
+        groups = set(await self.get_user_groups(user_id))
+        return {group_id: group_id in groups for group_id in group_ids}
+
+    async def get_user(self, user_id: str) -> User:
+        """
+        Get user information by ID.
+
+        See ``KeyrunesClient.get_user``.
+        """
+        self._require_token()
+
+        if self._is_token_user(user_id):
+            return self._token_user()
+
+        response = await self._make_request("GET", f"/api/users/{user_id}")
+        return self._normalize_user(response)
+
+    async def is_admin(self, user_id: str) -> bool:
+        """
+        Check if a user has admin privileges.
+
+        See ``KeyrunesClient.is_admin``.
+        """
+        self._require_token()
+
+        if self._is_token_user(user_id):
+            return self._has_admin_group(self._token_groups())
+
+        user = await self.get_user(user_id)
+        return user.is_admin
+
+    async def get_current_user(self) -> User:
+        """
+        Get currently authenticated user information.
+
+        See ``KeyrunesClient.get_current_user``.
+        """
+        self._require_token()
+
+        login_user = self._cached_login_user()
+        if login_user is not None:
+            return login_user
+
+        if self._token_data:
+            return self._token_user()
+
+        response = await self._make_request("GET", "/api/users/me")
+        return self._normalize_user(response)
+
+    async def get_user_groups(self, user_id: Optional[str] = None) -> List[str]:
+        """
+        Get list of groups for a user.
+
+        See ``KeyrunesClient.get_user_groups``.
+        """
+        if user_id:
+            user = await self.get_user(user_id)
+        else:
+            user = await self.get_current_user()
+
+        return user.groups
+
+    async def close(self) -> None:
+        """Close HTTP client and release its pooled connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncKeyrunesClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Async context manager exit."""
+        await self.close()
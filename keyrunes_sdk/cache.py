@@ -0,0 +1,110 @@
+"""In-process caching helpers for Keyrunes SDK."""
+
+import time
+from threading import Lock
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Thread-safe mapping whose entries expire after a time-to-live.
+
+    Used to memoize idempotent authorization lookups (such as group
+    membership checks) so repeated checks for the same principal within
+    ``ttl`` seconds skip the HTTP round-trip. When the cache is full the
+    oldest entry is evicted. ``ttl`` is the default lifetime of an entry and
+    ``set`` may override it per entry; entries whose lifetime is 0 are not
+    stored.
+
+    Args:
+        maxsize: Maximum number of entries kept (default: 1024)
+        ttl: Default entry lifetime in seconds (default: 30)
+        timer: Monotonic clock used to timestamp entries
+
+    Example:
+        >>> cache = TTLCache(maxsize=128, ttl=30)
+        >>> cache.set(("user123", "admins"), True)
+        >>> cache.get(("user123", "admins"))
+        True
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 30.0,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty cache."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data: Dict[K, Tuple[float, V]] = {}
+        self._lock = Lock()
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """
+        Return the cached value for key, or default if missing or expired.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at <= self._timer():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """
+        Store value under key for ``ttl`` seconds.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Lifetime of this entry in seconds; defaults to the cache's
+                ``ttl``. Entries with a lifetime of 0 are not stored
+        """
+        lifetime = self.ttl if ttl is None else ttl
+        if lifetime <= 0 or self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                self._evict()
+            self._data[key] = (self._timer() + lifetime, value)
+
+    def discard_where(self, predicate: Callable[[K], bool]) -> None:
+        """Remove every entry whose key matches predicate."""
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        """Return number of stored (possibly expired) entries."""
+        return len(self._data)
+
+    def _evict(self) -> None:
+        """Drop expired entries, or the oldest one if none expired."""
+        now = self._timer()
+        expired = [k for k, (exp, _) in self._data.items() if exp <= now]
+        for key in expired:
+            del self._data[key]
+        if not expired:
+            del self._data[next(iter(self._data))]
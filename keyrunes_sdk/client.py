@@ -1,12 +1,16 @@
 """Keyrunes API Client."""
 
 import os
-from typing import Any, Dict, List, Optional
-from urllib.parse import urljoin
+import time
+from concurrent.futures import Future
+from threading import Lock
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
 import httpx
 import jwt
 
+from keyrunes_sdk import _json
+from keyrunes_sdk.cache import TTLCache
 from keyrunes_sdk.exceptions import (
     AuthenticationError,
     AuthorizationError,
@@ -23,30 +27,25 @@ from keyrunes_sdk.models import (
     UserRegistration,
 )
 
+DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=10,
+    max_connections=20,
+    keepalive_expiry=30,
+)
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_GROUP_CACHE_TTL = 0.0
+GROUP_CACHE_MAXSIZE = 1024
+LOGIN_USER_EXPIRY_MARGIN = 5
 
-class KeyrunesClient:
-    """
-    Client for interacting with Keyrunes Authorization System.
 
-    This client provides methods for:
-    - User authentication (login)
-    - User registration
-    - Admin registration
-    - Group membership verification
-    - Authorization checks
-
-    Args:
-        base_url: Base URL of the Keyrunes API
-            (e.g., "https://keyrunes.example.com")
-        api_key: Optional API key for authentication
-        organization_key: Optional Organization Key (required for v0.2.0+)
-            If not provided, looks for KEYRUNES_ORG_KEY env var
-        timeout: Request timeout in seconds (default: 30)
+class BaseKeyrunesClient:
+    """
+    Transport-independent state and helpers shared by the Keyrunes clients.
 
-    Example:
-        >>> client = KeyrunesClient("https://keyrunes.example.com")
-        >>> token = client.login("user@example.com", "password123")
-        >>> print(token.access_token)
+    Holds the connection settings and the authentication token, and knows how
+    to translate API responses into SDK models and exceptions. Subclasses
+    provide the actual HTTP transport (see ``KeyrunesClient`` and
+    ``AsyncKeyrunesClient``).
     """
 
     def __init__(
@@ -55,8 +54,9 @@ class KeyrunesClient:
         api_key: Optional[str] = None,
         organization_key: Optional[str] = None,
         timeout: int = 30,
+        group_cache_ttl: float = DEFAULT_GROUP_CACHE_TTL,
     ) -> None:
-        """Initialize Keyrunes client."""
+        """Initialize shared client state."""
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         # Prioritize explicit argument, then env var
@@ -65,83 +65,125 @@ class KeyrunesClient:
         )
         self.timeout = timeout
         self._token: Optional[str] = None
+        # (token, headers) pair, so headers are never paired with a stale
+        # token even when _token is assigned directly.
+        self._auth_headers: Tuple[Optional[str], Dict[str, str]] = (None, {})
         self._token_data: Optional[Dict[str, Any]] = None
-        self._client = httpx.Client(timeout=timeout)
-
-        if api_key:
-            self._client.headers.update({"X-API-Key": api_key})
+        self._group_cache: TTLCache[Tuple[str, str], bool] = TTLCache(
+            maxsize=GROUP_CACHE_MAXSIZE, ttl=group_cache_ttl
+        )
+        # Access granted by the decorators, keyed by (user_id, decorator
+        # scope); each decorator stores its entries with its own cache_ttl.
+        self._grant_cache: TTLCache[Tuple[str, Hashable], bool] = TTLCache(
+            maxsize=GROUP_CACHE_MAXSIZE, ttl=0
+        )
+        self._login_user: Optional[Tuple[User, Optional[float]]] = None
 
+    def _http_options(self) -> Dict[str, Any]:
+        """Build keyword arguments for the underlying httpx client."""
+        headers: Dict[str, str] = {}
+        if self.api_key:
+            headers["X-API-Key"] = self.api_key
         if self.organization_key:
-            self._client.headers.update(
-                {"X-Organization-Key": self.organization_key}
-            )
+            headers["X-Organization-Key"] = self.organization_key
 
-    def _make_request(
-        self,
-        method: str,
-        endpoint: str,
-        data: Optional[Dict[str, Any]] = None,
-        params: Optional[Dict[str, Any]] = None,
-        use_auth: bool = True,
+        return {
+            "base_url": self.base_url,
+            "headers": headers,
+            "timeout": httpx.Timeout(
+                self.timeout,
+                connect=min(self.timeout, DEFAULT_CONNECT_TIMEOUT),
+            ),
+        }
+
+    @staticmethod
+    def _pool_options(
+        limits: Optional[httpx.Limits], http2: bool
     ) -> Dict[str, Any]:
         """
-        Make HTTP request to Keyrunes API.
+        Build httpx client keyword arguments for the default pooled transport.
+
+        The settings go to the httpx client itself rather than through
+        ``transport=``, so httpx keeps honouring the proxy environment
+        variables (``HTTPS_PROXY``, ``NO_PROXY``, ...). The SSL context is
+        built here, once per client, and shared by all of its connections.
 
         Args:
-            method: HTTP method (GET, POST, etc.)
-            endpoint: API endpoint
-            data: Request body data
-            params: Query parameters
-            use_auth: Whether to include authentication header
+            limits: Connection pool limits, or None for DEFAULT_LIMITS
+            http2: Whether to negotiate HTTP/2 with the server
 
         Returns:
-            Response JSON data
+            Keyword arguments for ``httpx.Client`` or ``httpx.AsyncClient``
+        """
+        return {
+            "verify": httpx.create_ssl_context(),
+            "limits": limits or DEFAULT_LIMITS,
+            "http2": http2,
+        }
+
+    def _request_headers(self, use_auth: bool) -> Dict[str, str]:
+        """
+        Return per-request headers (authorization, if requested).
+
+        The returned mapping is shared between requests and must not be
+        mutated; it is rebuilt only when the token changes.
+        """
+        token = self._token
+        if not use_auth or not token:
+            return {}
+        cached_token, headers = self._auth_headers
+        if cached_token != token:
+            headers = {"Authorization": f"Bearer {token}"}
+            self._auth_headers = (token, headers)
+        return headers
+
+    def _request_options(
+        self,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        use_auth: bool,
+    ) -> Dict[str, Any]:
+        """Build keyword arguments for a single httpx request."""
+        headers = self._request_headers(use_auth)
+        content = None
+        if data is not None:
+            content = _json.dumps(data)
+            headers = {**headers, "Content-Type": "application/json"}
+        return {"content": content, "params": params, "headers": headers}
+
+    @staticmethod
+    def _handle_response(response: httpx.Response) -> Dict[str, Any]:
+        """
+        Map an API response to its JSON payload or an SDK exception.
 
         Raises:
-            NetworkError: If request fails
+            NetworkError: If the server returned an unexpected error
             AuthenticationError: If authentication fails (401)
             AuthorizationError: If authorization fails (403)
+            UserNotFoundError: If the resource does not exist (404)
         """
-        url = urljoin(self.base_url + "/", endpoint.lstrip("/"))
-        headers = {}
-
-        if use_auth and self._token:
-            headers["Authorization"] = f"Bearer {self._token}"
-
-        try:
-            response = self._client.request(
-                method=method,
-                url=url,
-                json=data,
-                params=params,
-                headers=headers,
+        if response.status_code == 401:
+            raise AuthenticationError(
+                "Authentication failed. Invalid credentials or token."
             )
-
-            if response.status_code == 401:
-                raise AuthenticationError(
-                    "Authentication failed. Invalid credentials or token."
-                )
-            elif response.status_code == 403:
-                raise AuthorizationError(
-                    "Authorization denied. Insufficient permissions."
+        elif response.status_code == 403:
+            raise AuthorizationError(
+                "Authorization denied. Insufficient permissions."
+            )
+        elif response.status_code == 404:
+            raise UserNotFoundError("Resource not found.")
+        elif response.status_code >= 400:
+            try:
+                error_data = _json.loads(response.content)
+                error_msg = error_data.get("error", response.text)
+            except (ValueError, TypeError):
+                error_msg = (
+                    response.text or f"HTTP {response.status_code} error"
                 )
-            elif response.status_code == 404:
-                raise UserNotFoundError("Resource not found.")
-            elif response.status_code >= 400:
-                try:
-                    error_data = response.json()
-                    error_msg = error_data.get("error", response.text)
-                except (ValueError, TypeError):
-                    error_msg = (
-                        response.text or f"HTTP {response.status_code} error"
-                    )
-                raise NetworkError(f"Request failed: {error_msg}")
-
-            result: Dict[str, Any] = response.json()
-            return result
+            raise NetworkError(f"Request failed: {error_msg}")
 
-        except httpx.RequestError as e:
-            raise NetworkError(f"Network request failed: {str(e)}")
+        result: Dict[str, Any] = _json.loads(response.content)
+        return result
 
     @staticmethod
     def _normalize_user(data: Dict[str, Any]) -> User:
@@ -158,15 +200,36 @@ class KeyrunesClient:
         normalized["groups"] = data.get("groups", []) or []
         normalized["attributes"] = data.get("attributes", {})
         normalized["is_active"] = data.get("is_active", True)
-        groups = normalized["groups"]
-        is_admin_flag = data.get("is_admin", False)
-        has_admin_group = "admins" in groups or "superadmin" in groups
-        has_admin_in_name = any("admin" in str(g).lower() for g in groups)
-        normalized["is_admin"] = (
-            is_admin_flag or has_admin_group or has_admin_in_name
-        )
+        normalized["is_admin"] = bool(
+            data.get("is_admin", False)
+        ) or BaseKeyrunesClient._has_admin_group(normalized["groups"])
         return User(**normalized)
 
+    @staticmethod
+    def _has_admin_group(groups: List[str]) -> bool:
+        """Check whether any of groups grants admin privileges."""
+        return (
+            "admins" in groups
+            or "superadmin" in groups
+            or any("admin" in str(g).lower() for g in groups)
+        )
+
+    @staticmethod
+    def _login_credentials(
+        username: str, password: str, namespace: str
+    ) -> LoginCredentials:
+        """
+        Build login credentials, rejecting empty ones before any request.
+
+        Raises:
+            ValueError: If username or password is empty
+        """
+        if not username or not password:
+            raise ValueError("Username and password credentials are required.")
+        return LoginCredentials(
+            identity=username, password=password, namespace=namespace
+        )
+
     def _parse_token_response(self, payload: Dict[str, Any]) -> Token:
         """
         Accept both legacy and current API token responses.
@@ -203,6 +266,307 @@ class KeyrunesClient:
             user=user_model,
         )
 
+    def _registered_user(self, response: Any, kind: str) -> User:
+        """Extract the created user from a registration response."""
+        user_payload = (
+            response.get("user") if isinstance(response, dict) else None
+        )
+        if not user_payload:
+            raise NetworkError(
+                f"Unexpected response format for {kind} registration."
+            )
+
+        return self._normalize_user(user_payload)
+
+    def _remember_login_user(self, token: Token) -> None:
+        """
+        Keep the user profile returned by login for get_current_user.
+
+        The profile is reused until shortly before the token expires (or
+        until the token changes, when the server gives no expiry).
+        """
+        if token.user is None:
+            return
+
+        expires_at = (
+            time.monotonic() + token.expires_in - LOGIN_USER_EXPIRY_MARGIN
+            if token.expires_in
+            else None
+        )
+        self._login_user = (token.user, expires_at)
+
+    def _cached_login_user(self) -> Optional[User]:
+        """Return the profile kept from login, if still valid."""
+        if self._login_user is None:
+            return None
+
+        user, expires_at = self._login_user
+        if expires_at is not None and time.monotonic() >= expires_at:
+            self._login_user = None
+            return None
+        return user
+
+    def _require_token(self) -> None:
+        """Raise AuthenticationError if no token is set."""
+        if not self._token:
+            raise AuthenticationError("Not authenticated. Please login first.")
+
+    def _is_token_user(self, user_id: str) -> bool:
+        """Check whether user_id is the subject of the current token."""
+        token_user_id = (
+            str(self._token_data.get("sub", "")) if self._token_data else None
+        )
+        return bool(token_user_id) and str(user_id) == token_user_id
+
+    def _token_groups(self) -> List[str]:
+        """Return the groups claimed by the current token."""
+        return self._token_data.get("groups", []) if self._token_data else []
+
+    def _token_user(self) -> User:
+        """Build a User from the claims of the current token."""
+        token_data = self._token_data or {}
+        user_data = {
+            "id": str(token_data.get("sub", "")),
+            "username": token_data.get("username", ""),
+            "email": token_data.get("email", ""),
+            "groups": token_data.get("groups", []),
+        }
+        return self._normalize_user(user_data)
+
+    def set_token(self, token: str) -> None:
+        """
+        Set authentication token for subsequent requests.
+
+        Args:
+            token: JWT access token
+
+        Example:
+            >>> client = KeyrunesClient("https://keyrunes.example.com")
+            >>> client.set_token("eyJhbGciOiJIUzI1NiIs...")
+        """
+        self._token = token
+        self._login_user = None
+        self._group_cache.clear()
+        self._grant_cache.clear()
+        try:
+            self._token_data = jwt.decode(
+                token, options={"verify_signature": False}
+            )
+        except Exception:
+            self._token_data = None
+
+    def clear_token(self) -> None:
+        """
+        Clear authentication token.
+
+        Example:
+            >>> client = KeyrunesClient("https://keyrunes.example.com")
+            >>> client.clear_token()
+        """
+        self._token = None
+        self._token_data = None
+        self._login_user = None
+        self._group_cache.clear()
+        self._grant_cache.clear()
+
+    def invalidate_user(self, user_id: str) -> None:
+        """
+        Drop cached group membership results and decorator grants for a user.
+
+        Call this after changing a user's groups so the next check reaches
+        the server instead of returning a cached answer.
+
+        Args:
+            user_id: User ID whose cached results should be discarded
+
+        Example:
+            >>> client = KeyrunesClient("https://keyrunes.example.com")
+            >>> client.invalidate_user("user123")
+        """
+        user_key = str(user_id)
+        self._group_cache.discard_where(lambda key: key[0] == user_key)
+        self._grant_cache.discard_where(lambda key: key[0] == user_key)
+
+
+class KeyrunesClient(BaseKeyrunesClient):
+    """
+    Client for interacting with Keyrunes Authorization System.
+
+    This client provides methods for:
+    - User authentication (login)
+    - User registration
+    - Admin registration
+    - Group membership verification
+    - Authorization checks
+
+    Args:
+        base_url: Base URL of the Keyrunes API
+            (e.g., "https://keyrunes.example.com")
+        api_key: Optional API key for authentication
+        organization_key: Optional Organization Key (required for v0.2.0+)
+            If not provided, looks for KEYRUNES_ORG_KEY env var
+        timeout: Request timeout in seconds; connecting is capped at
+            DEFAULT_CONNECT_TIMEOUT (5 s) when this is larger (default: 30)
+        limits: Connection pool limits for the underlying HTTP client
+            (default: DEFAULT_LIMITS)
+        http2: Whether to negotiate HTTP/2 with the server; requires the
+            ``httpx[http2]`` extra to be installed (default: False)
+        group_cache_ttl: Seconds a group membership result is cached, so a
+            revoked membership is honoured only after it expires; 0 disables
+            the cache (default: 0)
+        transport: Optional httpx transport to send requests through
+            instead of the default pooled one (e.g. ``httpx.MockTransport``
+            in tests); ``limits``, ``http2`` and environment proxies are
+            ignored when given
+
+    The client keeps a single pooled ``httpx.Client`` for its whole lifetime,
+    so consecutive calls reuse keep-alive connections instead of paying a new
+    TCP/TLS handshake each time. Its connections share one SSL context built
+    for the client, and proxies set in the environment (``HTTPS_PROXY``,
+    ``NO_PROXY``, ...) are honoured. Call ``close()`` (or use the client as a context manager) to release the pool.
+
+    Example:
+        >>> client = KeyrunesClient("https://keyrunes.example.com")
+        >>> token = client.login("user@example.com", "password123")
+        >>> print(token.access_token)
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        organization_key: Optional[str] = None,
+        timeout: int = 30,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        group_cache_ttl: float = DEFAULT_GROUP_CACHE_TTL,
+        transport: Optional[httpx.BaseTransport] = None,
+    ) -> None:
+        """Initialize Keyrunes client."""
+        super().__init__(
+            base_url=base_url,
+            api_key=api_key,
+            organization_key=organization_key,
+            timeout=timeout,
+            group_cache_ttl=group_cache_ttl,
+        )
+        if transport is None:
+            pool_options = self._pool_options(limits, http2)
+        else:
+            pool_options = {"transport": transport}
+        self._client = httpx.Client(**pool_options, **self._http_options())
+        self._inflight: Dict[Tuple[Any, ...], "Future[Dict[str, Any]]"] = {}
+        self._inflight_lock = Lock()
+
+    def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        use_auth: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Make HTTP request to Keyrunes API.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint, relative to ``base_url``
+            data: Request body data
+            params: Query parameters
+            use_auth: Whether to include authentication header
+
+        Returns:
+            Response JSON data
+
+        Raises:
+            NetworkError: If request fails
+            AuthenticationError: If authentication fails (401)
+            AuthorizationError: If authorization fails (403)
+
+        Concurrent GET requests for the same endpoint, parameters and token
+        are coalesced: the first caller performs the HTTP request and the
+        others wait for and share its result.
+        """
+        key = self._inflight_key(method, endpoint, data, params, use_auth)
+        if key is None:
+            return self._send_request(method, endpoint, data, params, use_auth)
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if future is None:
+                future = self._inflight[key] = Future()
+
+        if not is_leader:
+            return dict(future.result())
+
+        try:
+            result = self._send_request(
+                method, endpoint, data, params, use_auth
+            )
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _inflight_key(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        use_auth: bool,
+    ) -> Optional[Tuple[Any, ...]]:
+        """
+        Return the key identifying a coalescable request.
+
+        Multi-valued query parameters (lists or tuples) are normalized to
+        tuples; requests that are not body-less GETs, or whose parameters
+        are otherwise unhashable, are not coalesced.
+
+        Returns:
+            Hashable request key, or None if the request must be sent alone
+        """
+        if method.upper() != "GET" or data is not None:
+            return None
+
+        items = tuple(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in sorted((params or {}).items())
+        )
+        key = (endpoint, items, self._token if use_auth else None)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        use_auth: bool,
+    ) -> Dict[str, Any]:
+        """Perform a single HTTP request and handle its response."""
+        try:
+            response = self._client.request(
+                method=method,
+                url=endpoint,
+                **self._request_options(data, params, use_auth),
+            )
+            return self._handle_response(response)
+
+        except httpx.RequestError as e:
+            raise NetworkError(f"Network request failed: {str(e)}")
+
     def login(
         self, username: str, password: str, namespace: str = "public"
     ) -> Token:
@@ -219,6 +583,7 @@ class KeyrunesClient:
 
         Raises:
             AuthenticationError: If login fails
+            ValueError: If username or password is empty
 
         Example:
             >>> client = KeyrunesClient("https://keyrunes.example.com")
@@ -227,9 +592,7 @@ class KeyrunesClient:
             ... )
             >>> client.set_token(token.access_token)
         """
-        credentials = LoginCredentials(
-            identity=username, password=password, namespace=namespace
-        )
+        credentials = self._login_credentials(username, password, namespace)
         response = self._make_request(
             "POST",
             "/api/login",
@@ -238,13 +601,8 @@ class KeyrunesClient:
         )
 
         token = self._parse_token_response(response)
-        self._token = token.access_token
-        try:
-            self._token_data = jwt.decode(
-                token.access_token, options={"verify_signature": False}
-            )
-        except Exception:
-            self._token_data = None
+        self.set_token(token.access_token)
+        self._remember_login_user(token)
         return token
 
     def register_user(
@@ -295,15 +653,7 @@ class KeyrunesClient:
             use_auth=False,
         )
 
-        user_payload = (
-            response.get("user") if isinstance(response, dict) else None
-        )
-        if not user_payload:
-            raise NetworkError(
-                "Unexpected response format for user registration."
-            )
-
-        return self._normalize_user(user_payload)
+        return self._registered_user(response, "user")
 
     def register_admin(
         self,
@@ -356,15 +706,7 @@ class KeyrunesClient:
             use_auth=False,
         )
 
-        user_payload = (
-            response.get("user") if isinstance(response, dict) else None
-        )
-        if not user_payload:
-            raise NetworkError(
-                "Unexpected response format for admin registration."
-            )
-
-        return self._normalize_user(user_payload)
+        return self._registered_user(response, "admin")
 
     def has_group(self, user_id: str, group_id: str) -> bool:
         """
@@ -388,18 +730,15 @@ class KeyrunesClient:
             >>> if has_access:
             ...     print("User has admin access")
         """
-        if not self._token:
-            raise AuthenticationError("Not authenticated. Please login first.")
+        self._require_token()
 
-        token_user_id = (
-            str(self._token_data.get("sub", "")) if self._token_data else None
-        )
+        if self._is_token_user(user_id):
+            return group_id in self._token_groups()
 
-        if token_user_id and str(user_id) == token_user_id:
-            groups = (
-                self._token_data.get("groups", []) if self._token_data else []
-            )
-            return group_id in groups
+        cache_key = (str(user_id), group_id)
+        cached = self._group_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
             response = self._make_request(
@@ -407,19 +746,40 @@ class KeyrunesClient:
                 f"/api/users/{user_id}/groups/{group_id}",
             )
             check = GroupCheck(**response)
+            self._group_cache.set(cache_key, check.has_access)
             return check.has_access
         except UserNotFoundError:
-            if token_user_id and str(user_id) == token_user_id:
-                groups = (
-                    self._token_data.get("groups", [])
-                    if self._token_data
-                    else []
-                )
-                return group_id in groups
             raise GroupNotFoundError(
                 f"Group '{group_id}' not found or user not in group"
             )
 
+    def has_groups(self, user_id: str, group_ids: List[str]) -> Dict[str, bool]:
+        """
+        Check membership of a user in several groups with a single lookup.
+
+        The user's groups are fetched once and every requested group is
+        checked locally, instead of one ``has_group`` round-trip per group.
+
+        Args:
+            user_id: User ID to check
+            group_ids: Group IDs to verify membership
+
+        Returns:
+            Mapping of each group ID to whether the user belongs to it
+
+        Raises:
+            AuthenticationError: If not authenticated
+            UserNotFoundError: If user doesn't exist
+
+        Example:
+            >>> client = KeyrunesClient("https://keyrunes.example.com")
+            >>> client.login("user@example.com", "password")
+            >>> client.has_groups("user123", ["users", "admins"])
+            {'users': True, 'admins': False}
+        """
+        groups = set(self.get_user_groups(user_id))
+        return {group_id: group_id in groups for group_id in group_ids}
+
     def get_user(self, user_id: str) -> User:
         """
         Get user information by ID.
@@ -440,46 +800,51 @@ class KeyrunesClient:
             >>> user = client.get_user("user123")
             >>> print(user.username)
         """
-        if not self._token:
-            raise AuthenticationError("Not authenticated. Please login first.")
+        self._require_token()
 
-        token_user_id = (
-            str(self._token_data.get("sub", "")) if self._token_data else None
-        )
+        if self._is_token_user(user_id):
+            return self._token_user()
 
-        if token_user_id and str(user_id) == token_user_id and self._token_data:
-            token_data = self._token_data
-            user_data = {
-                "id": str(token_data.get("sub", "")),
-                "username": token_data.get("username", ""),
-                "email": token_data.get("email", ""),
-                "groups": token_data.get("groups", []),
-            }
-            return self._normalize_user(user_data)
+        response = self._make_request("GET", f"/api/users/{user_id}")
+        return self._normalize_user(response)
 
-        try:
-            response = self._make_request("GET", f"/api/users/{user_id}")
-            return self._normalize_user(response)
-        except UserNotFoundError:
-            if (
-                token_user_id
-                and str(user_id) == token_user_id
-                and self._token_data
-            ):
-                token_data = self._token_data
-                user_data = {
-                    "id": str(token_data.get("sub", "")),
-                    "username": token_data.get("username", ""),
-                    "email": token_data.get("email", ""),
-                    "groups": token_data.get("groups", []),
-                }
-                return self._normalize_user(user_data)
-            raise
+    def is_admin(self, user_id: str) -> bool:
+        """
+        Check if a user has admin privileges.
+
+        For the subject of the current token the answer comes from the
+        token's groups without a request; other users are looked up.
+
+        Args:
+            user_id: User ID to check
+
+        Returns:
+            True if the user is an admin, False otherwise
+
+        Raises:
+            AuthenticationError: If not authenticated
+            UserNotFoundError: If user doesn't exist
+
+        Example:
+            >>> client = KeyrunesClient("https://keyrunes.example.com")
+            >>> client.login("admin@example.com", "password")
+            >>> client.is_admin("user123")
+            False
+        """
+        self._require_token()
+
+        if self._is_token_user(user_id):
+            return self._has_admin_group(self._token_groups())
+
+        return self.get_user(user_id).is_admin
 
     def get_current_user(self) -> User:
         """
         Get currently authenticated user information.
 
+        The profile returned by ``login`` is reused while its token is valid,
+        so this normally needs no extra request after logging in.
+
         Returns:
             User object for authenticated user
 
@@ -492,33 +857,17 @@ class KeyrunesClient:
             >>> me = client.get_current_user()
             >>> print(f"Logged in as: {me.username}")
         """
-        if not self._token:
-            raise AuthenticationError("Not authenticated. Please login first.")
+        self._require_token()
+
+        login_user = self._cached_login_user()
+        if login_user is not None:
+            return login_user
 
         if self._token_data:
-            token_data = self._token_data
-            user_data = {
-                "id": str(token_data.get("sub", "")),
-                "username": token_data.get("username", ""),
-                "email": token_data.get("email", ""),
-                "groups": token_data.get("groups", []),
-            }
-            return self._normalize_user(user_data)
+            return self._token_user()
 
-        try:
-            response = self._make_request("GET", "/api/users/me")
-            return self._normalize_user(response)
-        except UserNotFoundError:
-            if self._token_data:
-                token_data = self._token_data
-                user_data = {
-                    "id": str(token_data.get("sub", "")),
-                    "username": token_data.get("username", ""),
-                    "email": token_data.get("email", ""),
-                    "groups": token_data.get("groups", []),
-                }
-                return self._normalize_user(user_data)
-            raise
+        response = self._make_request("GET", "/api/users/me")
+        return self._normalize_user(response)
 
     def get_user_groups(self, user_id: Optional[str] = None) -> List[str]:
         """
@@ -546,39 +895,9 @@ class KeyrunesClient:
 
         return user.groups
 
-    def set_token(self, token: str) -> None:
-        """
-        Set authentication token for subsequent requests.
-
-        Args:
-            token: JWT access token
-
-        Example:
-            >>> client = KeyrunesClient("https://keyrunes.example.com")
-            >>> client.set_token("eyJhbGciOiJIUzI1NiIs...")
-        """
-        self._token = token
-        try:
-            self._token_data = jwt.decode(
-                token, options={"verify_signature": False}
-            )
-        except Exception:
-            self._token_data = None
-
-    def clear_token(self) -> None:
-        """
-        Clear authentication token.
-
-        Example:
-            >>> client = KeyrunesClient("https://keyrunes.example.com")
-            >>> client.clear_token()
-        """
-        self._token = None
-        self._token_data = None
-
     def close(self) -> None:
         """
-        Close HTTP client.
+        Close HTTP client and release its pooled connections.
 
         Example:
             >>> client = KeyrunesClient("https://keyrunes.example.com")
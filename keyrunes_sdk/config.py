@@ -62,8 +62,9 @@ class _GlobalConfig:
             >>> if client:
             ...     user = client.get_current_user()
         """
-        with self._lock:
-            return self._client
+        # Reading a single attribute is atomic, so callers on the hot path
+        # (e.g. every decorated call) skip the lock; writers still take it.
+        return self._client
 
     def configure(
         self,
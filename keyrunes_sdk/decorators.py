@@ -1,41 +1,76 @@
 """Decorators for Keyrunes authorization."""
 
+import inspect
 from functools import wraps
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Optional, Tuple
 
-from keyrunes_sdk.client import KeyrunesClient
+from keyrunes_sdk.client import BaseKeyrunesClient, KeyrunesClient
+from keyrunes_sdk.config import get_global_client
 from keyrunes_sdk.exceptions import AuthorizationError, UserNotFoundError
 
+ClientGetter = Callable[[], Optional[KeyrunesClient]]
+
+
+def _sync_client(candidate: Any) -> KeyrunesClient:
+    """
+    Return candidate unless it is an asynchronous Keyrunes client.
+
+    The decorators call client methods synchronously; an async client would
+    hand back coroutines, which must not be mistaken for a granted check.
+    Other objects, such as duck-typed or mock clients, are passed through.
+
+    Raises:
+        TypeError: If candidate is a Keyrunes client other than
+            KeyrunesClient (e.g. AsyncKeyrunesClient)
+    """
+    if isinstance(candidate, BaseKeyrunesClient) and not isinstance(
+        candidate, KeyrunesClient
+    ):
+        raise TypeError(
+            "Keyrunes decorators require a synchronous KeyrunesClient, "
+            f"got {type(candidate).__name__}."
+        )
+    result: KeyrunesClient = candidate
+    return result
+
 
 def _get_client(
-    client: Optional[KeyrunesClient], kwargs: dict
+    client: Optional[KeyrunesClient],
+    kwargs: dict,
+    client_getter: Optional[ClientGetter] = None,
 ) -> KeyrunesClient:
     """
-    Get client from decorator, kwargs, or global config.
+    Get client from decorator, kwargs, client getter, or global config.
 
     Args:
         client: Client passed to decorator
         kwargs: Function kwargs that might contain 'client'
+        client_getter: Callable passed to decorator that returns the client
+            for the current call, or None
 
     Returns:
         KeyrunesClient instance
 
     Raises:
+        TypeError: If the client found is an asynchronous Keyrunes client
         ValueError: If no client is available
     """
-    if client:
-        return client
+    if client is not None:
+        return _sync_client(client)
 
     if "client" in kwargs:
         client_from_kwargs = kwargs["client"]
-        if isinstance(client_from_kwargs, KeyrunesClient):
-            return client_from_kwargs
+        if isinstance(client_from_kwargs, BaseKeyrunesClient):
+            return _sync_client(client_from_kwargs)
 
-    from keyrunes_sdk.config import get_global_client
+    if client_getter is not None:
+        client_from_getter = client_getter()
+        if client_from_getter is not None:
+            return _sync_client(client_from_getter)
 
     global_client = get_global_client()
     if global_client is not None:
-        return global_client
+        return _sync_client(global_client)
 
     raise ValueError(
         "KeyrunesClient not provided. Either:\n"
@@ -48,11 +83,90 @@ def _get_client(
     )
 
 
+def _user_id_index(func: Callable, user_id_param: str) -> Optional[int]:
+    """
+    Return the positional index of the user ID parameter of func.
+
+    Computed once when a function is decorated, so that calls do not pay
+    for signature introspection.
+
+    Args:
+        func: Decorated function
+        user_id_param: Name of the parameter containing user_id
+
+    Returns:
+        Parameter index, or None if func has no such parameter
+    """
+    param_names = list(inspect.signature(func).parameters)
+    if user_id_param in param_names:
+        return param_names.index(user_id_param)
+    return None
+
+
+def _resolve_user_id(
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+    user_id_param: str,
+    param_index: Optional[int],
+) -> Any:
+    """Get the user ID from call kwargs, falling back to positional args."""
+    user_id = kwargs.get(user_id_param)
+    if not user_id and param_index is not None and param_index < len(args):
+        user_id = args[param_index]
+    return user_id
+
+
+def _token_groups_for(
+    client: KeyrunesClient, user_id: Any
+) -> Optional[FrozenSet[str]]:
+    """
+    Return the token's groups if user_id is the authenticated subject.
+
+    Only Keyrunes clients carry token claims; any other client returns None
+    and is asked through ``has_group``.
+    """
+    if not isinstance(client, BaseKeyrunesClient):
+        return None
+    if client._token and client._is_token_user(user_id):
+        return frozenset(client._token_groups())
+    return None
+
+
+def _cached_grant(client: KeyrunesClient, key: Tuple[str, Hashable]) -> bool:
+    """Check whether client holds an unexpired grant for key."""
+    if not isinstance(client, BaseKeyrunesClient):
+        return False
+    return client._grant_cache.get(key) is True
+
+
+def _store_grant(
+    client: KeyrunesClient, key: Tuple[str, Hashable], ttl: float
+) -> None:
+    """Remember a grant on client for ttl seconds, if it keeps a cache."""
+    if ttl > 0 and isinstance(client, BaseKeyrunesClient):
+        client._grant_cache.set(key, True, ttl)
+
+
+def _check_admin(client: KeyrunesClient, user_id: Any) -> Any:
+    """
+    Ask client whether user_id is an admin, preferring ``is_admin``.
+
+    Clients without ``is_admin`` are checked through ``get_user``. The
+    result is returned unchanged so the caller can require an exact True.
+    """
+    is_admin = getattr(client, "is_admin", None)
+    if callable(is_admin):
+        return is_admin(user_id)
+    return client.get_user(user_id).is_admin
+
+
 def require_group(
     *group_ids: str,
     client: Optional[KeyrunesClient] = None,
     user_id_param: str = "user_id",
     all_groups: bool = False,
+    cache_ttl: float = 0,
+    client_getter: Optional[ClientGetter] = None,
 ) -> Callable:
     """
     Decorator to require user membership in one or more groups.
@@ -69,12 +183,22 @@ def require_group(
             (default: 'user_id')
         all_groups: If True, user must belong to ALL groups;
             if False, ANY group (default: False)
+        cache_ttl: Seconds a granted check is remembered on the client
+            for the user, so repeat calls skip the lookups; denials are
+            never cached, and grants are dropped by ``set_token``,
+            ``clear_token`` and ``invalidate_user``. Clients other than
+            Keyrunes clients are not cached. 0 disables the cache
+            (default: 0)
+        client_getter: Callable returning the client to use for each call
+            (e.g. reading a ContextVar); consulted after ``client`` and a
+            'client' kwarg, and before the global client
 
     Returns:
         Decorated function
 
     Raises:
         AuthorizationError: If user doesn't have required group membership
+        TypeError: If the client is an asynchronous Keyrunes client
         ValueError: If client is not provided
 
     Example:
@@ -104,23 +228,20 @@ def require_group(
         >>> admin_only_function(user_id="user123")
     """
 
+    # Deduplicated once here; order is kept so lookups stay predictable.
+    unique_group_ids = tuple(dict.fromkeys(group_ids))
+    required = frozenset(unique_group_ids)
+
     def decorator(func: Callable) -> Callable:
+        param_index = _user_id_index(func, user_id_param)
+        # Identifies this function's grants in the client's grant cache.
+        grant_scope = object()
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            keyrunes_client = _get_client(client, kwargs)
+            keyrunes_client = _get_client(client, kwargs, client_getter)
 
-            user_id = kwargs.get(user_id_param)
-
-            if not user_id:
-                import inspect
-
-                sig = inspect.signature(func)
-                param_names = list(sig.parameters.keys())
-
-                if user_id_param in param_names:
-                    param_index = param_names.index(user_id_param)
-                    if param_index < len(args):
-                        user_id = args[param_index]
+            user_id = _resolve_user_id(args, kwargs, user_id_param, param_index)
 
             if not user_id:
                 raise ValueError(
@@ -128,8 +249,20 @@ def require_group(
                     f"'{user_id_param}' in function arguments."
                 )
 
+            grant_key = (str(user_id), grant_scope)
+            if cache_ttl > 0 and _cached_grant(keyrunes_client, grant_key):
+                return func(*args, **kwargs)
+
+            token_groups = _token_groups_for(keyrunes_client, user_id)
+            if token_groups is not None:
+                # Groups are in the token: answer with a single set op.
+                if all_groups and required <= token_groups:
+                    return func(*args, **kwargs)
+                if not all_groups and not required.isdisjoint(token_groups):
+                    return func(*args, **kwargs)
+
             if all_groups:
-                for group_id in group_ids:
+                for group_id in unique_group_ids:
                     if not keyrunes_client.has_group(user_id, group_id):
                         raise AuthorizationError(
                             f"User '{user_id}' does not have required "
@@ -138,7 +271,7 @@ def require_group(
                         )
             else:
                 has_any_group = False
-                for group_id in group_ids:
+                for group_id in unique_group_ids:
                     if keyrunes_client.has_group(user_id, group_id):
                         has_any_group = True
                         break
@@ -149,6 +282,7 @@ def require_group(
                         f"the required groups: {group_ids}"
                     )
 
+            _store_grant(keyrunes_client, grant_key, cache_ttl)
             return func(*args, **kwargs)
 
         return wrapper
@@ -159,6 +293,8 @@ def require_group(
 def require_admin(
     client: Optional[KeyrunesClient] = None,
     user_id_param: str = "user_id",
+    cache_ttl: float = 0,
+    client_getter: Optional[ClientGetter] = None,
 ) -> Callable:
     """
     Decorator to require admin privileges.
@@ -170,12 +306,18 @@ def require_admin(
             (if None, expects 'client' in kwargs)
         user_id_param: Name of the parameter containing user_id
             (default: 'user_id')
+        cache_ttl: Seconds a granted check is remembered on the client
+            for the user; see ``require_group``. 0 disables the cache
+            (default: 0)
+        client_getter: Callable returning the client to use for each call;
+            see ``require_group``
 
     Returns:
         Decorated function
 
     Raises:
         AuthorizationError: If user doesn't have admin privileges
+        TypeError: If the client is an asynchronous Keyrunes client
 
     Example:
         >>> @require_admin()
@@ -185,62 +327,37 @@ def require_admin(
     """
 
     def decorator(func: Callable) -> Callable:
+        param_index = _user_id_index(func, user_id_param)
+        # Identifies this function's grants in the client's grant cache.
+        grant_scope = object()
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            keyrunes_client = _get_client(client, kwargs)
+            keyrunes_client = _get_client(client, kwargs, client_getter)
 
-            user_id = kwargs.get(user_id_param)
-            if not user_id:
-                import inspect
-
-                sig = inspect.signature(func)
-                param_names = list(sig.parameters.keys())
-
-                if user_id_param in param_names:
-                    param_index = param_names.index(user_id_param)
-                    if param_index < len(args):
-                        user_id = args[param_index]
+            user_id = _resolve_user_id(args, kwargs, user_id_param, param_index)
 
             if not user_id:
                 raise ValueError(
                     f"User ID not found in parameter '{user_id_param}'"
                 )
 
-            token_user_id = (
-                str(keyrunes_client._token_data.get("sub", ""))
-                if keyrunes_client._token_data
-                else None
-            )
-
-            if token_user_id and str(user_id) == token_user_id:
-                groups = (
-                    keyrunes_client._token_data.get("groups", [])
-                    if keyrunes_client._token_data
-                    else []
-                )
-                is_admin = (
-                    "admins" in groups
-                    or "superadmin" in groups
-                    or any("admin" in str(g).lower() for g in groups)
-                )
-                if not is_admin:
+            grant_key = (str(user_id), grant_scope)
+            if cache_ttl > 0 and _cached_grant(keyrunes_client, grant_key):
+                return func(*args, **kwargs)
+
+            try:
+                if _check_admin(keyrunes_client, user_id) is not True:
                     raise AuthorizationError(
                         f"User '{user_id}' does not have admin privileges."
                     )
-            else:
-                try:
-                    user = keyrunes_client.get_user(user_id)
-                    if not user.is_admin:
-                        raise AuthorizationError(
-                            f"User '{user_id}' does not have admin "
-                            f"privileges."
-                        )
-                except UserNotFoundError:
-                    raise AuthorizationError(
-                        f"User '{user_id}' not found or does not have "
-                        f"admin privileges."
-                    )
+            except UserNotFoundError:
+                raise AuthorizationError(
+                    f"User '{user_id}' not found or does not have "
+                    f"admin privileges."
+                )
 
+            _store_grant(keyrunes_client, grant_key, cache_ttl)
             return func(*args, **kwargs)
 
         return wrapper
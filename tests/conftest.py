@@ -1,39 +1,207 @@
 """Pytest configuration and fixtures."""
 
-from unittest.mock import MagicMock, Mock
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from unittest.mock import MagicMock
 
+import httpx
 import pytest
-from faker import Faker
 
-from keyrunes_sdk.client import KeyrunesClient
+from keyrunes_sdk.cache import TTLCache
+from keyrunes_sdk.client import GROUP_CACHE_MAXSIZE, KeyrunesClient
+from keyrunes_sdk.config import _GlobalConfig
 from keyrunes_sdk.models import Token, User
+from tests.factories import TokenFactory, UserFactory
 
-fake = Faker()
 
+class _StubRequest:
+    """
+    Lightweight stand-in for ``KeyrunesClient._make_request``.
 
-@pytest.fixture
+    Records each call in ``calls`` and returns ``result``, or raises
+    ``error`` when it is set.
+    """
+
+    def __init__(self) -> None:
+        self.calls: List[Tuple[Tuple[Any, ...], Dict[str, Any]]] = []
+        self.result: Any = {}
+        self.error: Optional[BaseException] = None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs))
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class _MockRouter:
+    """
+    Route table for an ``httpx.MockTransport``.
+
+    Responses are registered per ``(method, path)`` with ``add_response`` or
+    ``add_exception``; every request that reaches the transport is kept in
+    ``requests``.
+    """
+
+    def __init__(self) -> None:
+        self.routes: Dict[Tuple[str, str], Any] = {}
+        self.requests: List[httpx.Request] = []
+
+    def add_response(
+        self,
+        path: str,
+        method: str = "GET",
+        status_code: int = 200,
+        json: Any = None,
+    ) -> None:
+        self.routes[(method, path)] = httpx.Response(status_code, json=json)
+
+    def add_exception(
+        self, path: str, error: Exception, method: str = "GET"
+    ) -> None:
+        self.routes[(method, path)] = error
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        route = self.routes.get((request.method, request.url.path))
+        if route is None:
+            raise AssertionError(
+                f"No mocked route for {request.method} {request.url.path}"
+            )
+        if isinstance(route, Exception):
+            raise route
+        return route
+
+
+@pytest.fixture(autouse=True)
+def isolated_config(monkeypatch: pytest.MonkeyPatch) -> Iterator[_GlobalConfig]:
+    """Give every test its own global configuration."""
+    config = _GlobalConfig()
+    monkeypatch.setattr("keyrunes_sdk.config._config", config)
+    yield config
+    config.clear()
+
+
+@pytest.fixture(scope="session")
 def base_url() -> str:
     """Return base URL for tests."""
     return "https://keyrunes.example.com"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api_key() -> str:
     """Return API key for tests."""
     return "test-api-key-12345"
 
 
+@pytest.fixture(scope="session")
+def shared_client(base_url: str) -> Iterator[KeyrunesClient]:
+    """Return one client built once for the whole test session."""
+    client = KeyrunesClient(base_url=base_url)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def client(shared_client: KeyrunesClient) -> Iterator[KeyrunesClient]:
+    """Return the shared client, logged out and with no stubbed requests."""
+    shared_client.clear_token()
+    yield shared_client
+    shared_client.__dict__.pop("_make_request", None)
+    shared_client.clear_token()
+
+
+@pytest.fixture
+def http_mock() -> _MockRouter:
+    """Return an empty route table for ``http_client``."""
+    return _MockRouter()
+
+
 @pytest.fixture
-def mock_client(base_url: str, api_key: str) -> KeyrunesClient:
-    """Return mocked Keyrunes client."""
+def http_client(
+    base_url: str, http_mock: _MockRouter
+) -> Iterator[KeyrunesClient]:
+    """Return a client whose requests are answered by ``http_mock``."""
+    client = KeyrunesClient(
+        base_url=base_url, transport=httpx.MockTransport(http_mock)
+    )
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def stub_request() -> Callable[[KeyrunesClient, Any], _StubRequest]:
+    """Return a helper that answers a client's requests with ``payload``."""
+
+    def install(client: KeyrunesClient, payload: Any) -> _StubRequest:
+        stub = _StubRequest()
+        stub.result = payload
+        client._make_request = stub
+        return stub
+
+    return install
+
+
+def _stubbed_client(base_url: str, api_key: str) -> KeyrunesClient:
+    """Build a client whose HTTP layer is replaced by a ``_StubRequest``."""
     client = KeyrunesClient(base_url=base_url, api_key=api_key)
-    client._make_request = MagicMock()  # setup
+    client._make_request = _StubRequest()
     return client
 
 
 @pytest.fixture
+def mock_client(base_url: str, api_key: str) -> Iterator[KeyrunesClient]:
+    """Return a real Keyrunes client whose requests are stubbed out."""
+    client = _stubbed_client(base_url, api_key)
+    yield client
+    client.close()
+
+
+def _grant_by_default(client: MagicMock) -> None:
+    """Reset a spec'd client double to an unauthenticated, granting state."""
+    client._token = None
+    client._token_data = None
+    client._grant_cache.clear()
+    client.has_group.return_value = True
+    client.is_admin.return_value = True
+
+
+@pytest.fixture(scope="module")
+def _spec_module_client(base_url: str) -> Iterator[MagicMock]:
+    # spec_set from an instance (not the class) so that attributes set in
+    # __init__, such as _token, are part of the spec.
+    template = KeyrunesClient(base_url=base_url)
+    template.close()
+    client = MagicMock(spec_set=template)
+    client._grant_cache = TTLCache(maxsize=GROUP_CACHE_MAXSIZE, ttl=0)
+    _grant_by_default(client)
+    yield client
+
+
+@pytest.fixture
+def spec_client(_spec_module_client: MagicMock) -> Iterator[MagicMock]:
+    """
+    Return a module-shared ``MagicMock`` spec'd from a KeyrunesClient.
+
+    ``has_group`` and ``is_admin`` return True unless a test configures
+    them; the client keeps a real grant cache for the decorators. Mocks,
+    token and cache are reset after each test.
+    """
+    yield _spec_module_client
+    # Resetting return values on the whole mock would also drop those of
+    # magic methods such as __hash__, so only the stubbed methods are reset.
+    _spec_module_client.reset_mock()
+    for method in (
+        _spec_module_client.has_group,
+        _spec_module_client.get_user,
+        _spec_module_client.is_admin,
+    ):
+        method.reset_mock(return_value=True, side_effect=True)
+    _grant_by_default(_spec_module_client)
+
+
+@pytest.fixture(scope="session")
 def sample_user() -> User:
-    """Return sample user for testing."""
+    """Return sample user for testing (shared; do not mutate)."""
     return User(
         id="user123",
         username="testuser",
@@ -44,9 +212,9 @@ def sample_user() -> User:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_admin() -> User:
-    """Return sample admin user for testing."""
+    """Return sample admin user for testing (shared; do not mutate)."""
     return User(
         id="admin123",
         username="adminuser",
@@ -57,9 +225,9 @@ def sample_admin() -> User:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_token(sample_user: User) -> Token:
-    """Return sample token for testing."""
+    """Return sample token for testing (shared; do not mutate)."""
     return Token(
         access_token="eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.test",
         token_type="bearer",
@@ -68,10 +236,45 @@ def sample_token(sample_user: User) -> Token:
     )
 
 
+@pytest.fixture(scope="session")
+def factory_user() -> User:
+    """Return one factory-built user in three groups (shared; do not mutate)."""
+    return UserFactory(groups=["admins", "developers", "users"])
+
+
+@pytest.fixture(scope="session")
+def factory_token(factory_user: User) -> Token:
+    """Return one factory-built token for ``factory_user`` (shared)."""
+    return TokenFactory(user=factory_user)
+
+
+@pytest.fixture
+def sample_user_dict(sample_user: User) -> Dict[str, Any]:
+    """Return ``sample_user`` serialized once as an API payload."""
+    return sample_user.model_dump()
+
+
+@pytest.fixture
+def sample_admin_dict(sample_admin: User) -> Dict[str, Any]:
+    """Return ``sample_admin`` serialized once as an API payload."""
+    return sample_admin.model_dump()
+
+
+@pytest.fixture
+def sample_user_response(sample_user_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a registration response wrapping ``sample_user_dict``."""
+    return {"user": sample_user_dict}
+
+
+@pytest.fixture
+def sample_admin_response(
+    sample_admin_dict: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Return a registration response wrapping ``sample_admin_dict``."""
+    return {"user": sample_admin_dict}
+
+
 @pytest.fixture
-def mock_response() -> Mock:
-    """Return mock response object."""
-    response = Mock()
-    response.status_code = 200
-    response.json.return_value = {}
-    return response
+def sample_token_dict(sample_token: Token) -> Dict[str, Any]:
+    """Return ``sample_token`` serialized once as an API payload."""
+    return sample_token.model_dump()
@@ -1,8 +1,12 @@
 """Factory Boy factories for testing."""
 
-from datetime import datetime
+import itertools
+from datetime import datetime, timezone
+from typing import Any, Dict
+from uuid import uuid4
 
 import factory
+import factory.random
 from factory import Faker, LazyAttribute
 from faker import Faker as FakerInstance
 
@@ -15,31 +19,70 @@ from keyrunes_sdk.models import (
     UserRegistration,
 )
 
+FAKER_SEED = 0
+
+# One Faker shared by these factories. Seeding factory_boy's random state
+# also seeds every ``factory.Faker`` declaration, so generated data is
+# reproducible across runs.
 fake_instance = FakerInstance()
+factory.random.reseed_random(FAKER_SEED)
+
+
+def _utcnow() -> datetime:
+    """Return the current UTC time as a naive datetime, like the models."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+_user_counter = itertools.count()
+_NOW = _utcnow()
+
+
+def make_user(**overrides: Any) -> User:
+    """
+    Build a User from plain values, without Faker provider lookups.
+
+    Cheap enough to create thousands of fixtures per test; any field can be
+    overridden by keyword.
+    """
+    n = next(_user_counter)
+    fields: Dict[str, Any] = {
+        "id": uuid4().hex,
+        "username": f"user{n}",
+        "email": f"user{n}@example.com",
+        "groups": ["users", "developers"],
+        "attributes": {},
+        "created_at": _NOW,
+        "updated_at": _NOW,
+        "is_active": True,
+        "is_admin": False,
+    }
+    fields.update(overrides)
+    return User(**fields)
 
 
 class UserFactory(factory.Factory):
-    """Factory for User model."""
+    """Factory for User model (delegates to make_user)."""
 
     class Meta:
         model = User
 
-    id = Faker("uuid4")
-    username = Faker("user_name")
-    email = Faker("email")
-    groups = LazyAttribute(lambda _: [fake_instance.word() for _ in range(2)])
-    attributes = factory.Dict({})
-    created_at = Faker("date_time_this_year")
-    updated_at = Faker("date_time_this_month")
     is_active = True
     is_admin = False
 
+    @classmethod
+    def _build(cls, model_class: type, *args: Any, **kwargs: Any) -> User:
+        return make_user(**kwargs)
+
+    @classmethod
+    def _create(cls, model_class: type, *args: Any, **kwargs: Any) -> User:
+        return make_user(**kwargs)
+
 
 class AdminUserFactory(UserFactory):
     """Factory for Admin User."""
 
     is_admin = True
-    groups = LazyAttribute(lambda _: ["admins", fake_instance.word()])
+    groups = factory.LazyFunction(lambda: ["admins", "users"])
 
 
 class GroupFactory(factory.Factory):
@@ -103,4 +146,4 @@ class GroupCheckFactory(factory.Factory):
     user_id = Faker("uuid4")
     group_id = Faker("word")
     has_access = True
-    checked_at = factory.LazyFunction(datetime.utcnow)
+    checked_at = factory.LazyFunction(_utcnow)
@@ -0,0 +1,347 @@
+"""Tests for Keyrunes SDK asynchronous client."""
+
+import asyncio
+from typing import Any, Dict, Iterator
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from keyrunes_sdk.async_client import AsyncKeyrunesClient
+from keyrunes_sdk.exceptions import (
+    AuthenticationError,
+    GroupNotFoundError,
+    NetworkError,
+    UserNotFoundError,
+)
+from keyrunes_sdk.models import Token, User
+
+
+@pytest.fixture
+def async_client(base_url: str) -> Iterator[AsyncKeyrunesClient]:
+    """Return asynchronous client with a mocked request method."""
+    client = AsyncKeyrunesClient(base_url=base_url)
+    client._make_request = AsyncMock()
+    yield client
+    asyncio.run(client.close())
+
+
+@pytest.fixture
+def async_http_client(
+    base_url: str, http_mock
+) -> Iterator[AsyncKeyrunesClient]:
+    """Return asynchronous client whose requests are answered by http_mock."""
+    client = AsyncKeyrunesClient(
+        base_url=base_url, transport=httpx.MockTransport(http_mock)
+    )
+    yield client
+    asyncio.run(client.close())
+
+
+OTHER_USER = {
+    "id": "other",
+    "username": "otheruser",
+    "email": "other@example.com",
+    "groups": ["users", "developers"],
+    "is_admin": False,
+}
+
+TOKEN_CLAIMS = {
+    "sub": "user123",
+    "username": "testuser",
+    "email": "testuser@example.com",
+    "groups": ["users", "admins"],
+}
+
+
+class TestAsyncKeyrunesClient:
+    """Tests for AsyncKeyrunesClient."""
+
+    def test_init(self, base_url: str, api_key: str) -> None:
+        """Test client initialization."""
+        client = AsyncKeyrunesClient(base_url=base_url + "/", api_key=api_key)
+
+        assert client.base_url == base_url
+        assert client._client.headers["X-API-Key"] == api_key
+        assert client._token is None
+        asyncio.run(client.close())
+
+    def test_context_manager(self, base_url: str) -> None:
+        """Test using client as async context manager."""
+
+        async def run() -> bool:
+            async with AsyncKeyrunesClient(base_url=base_url) as client:
+                assert isinstance(client, AsyncKeyrunesClient)
+            return client._client.is_closed
+
+        assert asyncio.run(run()) is True
+
+    def test_make_request_success(
+        self, async_http_client: AsyncKeyrunesClient, http_mock
+    ) -> None:
+        """Test successful API request."""
+        http_mock.add_response("/api/v1/test", json={"data": "test"})
+
+        result = asyncio.run(
+            async_http_client._make_request("GET", "/api/v1/test")
+        )
+
+        assert result == {"data": "test"}
+        assert len(http_mock.requests) == 1
+
+    def test_make_request_not_found_error(
+        self, async_http_client: AsyncKeyrunesClient, http_mock
+    ) -> None:
+        """Test request with not found error."""
+        http_mock.add_response("/api/v1/test", status_code=404)
+
+        with pytest.raises(UserNotFoundError):
+            asyncio.run(async_http_client._make_request("GET", "/api/v1/test"))
+
+    def test_make_request_network_error(
+        self, async_http_client: AsyncKeyrunesClient, http_mock
+    ) -> None:
+        """Test request with network error."""
+        http_mock.add_exception(
+            "/api/v1/test", httpx.ConnectError("Network error")
+        )
+
+        with pytest.raises(NetworkError):
+            asyncio.run(async_http_client._make_request("GET", "/api/v1/test"))
+
+
+class TestAsyncClientOperations:
+    """Tests for asynchronous client operations."""
+
+    def test_login_sets_token(
+        self,
+        async_client: AsyncKeyrunesClient,
+        sample_token: Token,
+        sample_token_dict: Dict[str, Any],
+    ) -> None:
+        """Test that login sets token automatically."""
+        async_client._make_request.return_value = sample_token_dict
+
+        token = asyncio.run(async_client.login("testuser", "password123"))
+
+        assert token.access_token == sample_token.access_token
+        assert async_client._token == sample_token.access_token
+
+    def test_register_user(
+        self,
+        async_client: AsyncKeyrunesClient,
+        sample_user: User,
+        sample_user_response: Dict[str, Any],
+    ) -> None:
+        """Test successful user registration."""
+        async_client._make_request.return_value = sample_user_response
+
+        user = asyncio.run(
+            async_client.register_user(
+                username="newuser",
+                email="newuser@example.com",
+                password="password123",
+            )
+        )
+
+        assert user.username == sample_user.username
+
+    def test_has_group_requires_token(
+        self, async_client: AsyncKeyrunesClient
+    ) -> None:
+        """Test that group checks require authentication."""
+        with pytest.raises(AuthenticationError):
+            asyncio.run(async_client.has_group("user123", "admins"))
+
+    def test_has_group_not_found(
+        self, async_client: AsyncKeyrunesClient
+    ) -> None:
+        """Test checking non-existent group for another user."""
+        async_client._token = "test-token"
+        async_client._make_request.side_effect = UserNotFoundError("Not found")
+
+        with pytest.raises(GroupNotFoundError):
+            asyncio.run(async_client.has_group("other", "nonexistent"))
+
+    def test_is_admin(
+        self,
+        async_client: AsyncKeyrunesClient,
+        sample_admin_dict: Dict[str, Any],
+    ) -> None:
+        """Test admin check for another user."""
+        async_client._token = "test-token"
+        async_client._make_request.return_value = sample_admin_dict
+
+        assert asyncio.run(async_client.is_admin("admin123")) is True
+        async_client._make_request.assert_awaited_once()
+
+    def test_concurrent_lookups(
+        self, async_client: AsyncKeyrunesClient, sample_user: User
+    ) -> None:
+        """Test that independent lookups can be gathered concurrently."""
+        async_client._token = "test-token"
+        async_client._token_data = {
+            "sub": "user123",
+            "username": sample_user.username,
+            "email": sample_user.email,
+            "groups": ["users"],
+        }
+        async_client._make_request.return_value = {
+            "user_id": "other",
+            "group_id": "admins",
+            "has_access": True,
+        }
+
+        async def run() -> tuple:
+            return await asyncio.gather(
+                async_client.get_current_user(),
+                async_client.has_group("user123", "users"),
+                async_client.has_group("other", "admins"),
+                async_client.get_user_groups(),
+            )
+
+        me, has_users, other_is_admin, groups = asyncio.run(run())
+
+        assert me.id == "user123"
+        assert has_users is True
+        assert other_is_admin is True
+        assert groups == ["users"]
+        async_client._make_request.assert_awaited_once()
+
+
+class TestAsyncClientRequests:
+    """Tests for asynchronous operations driven through http_mock."""
+
+    def test_register_admin(
+        self, async_http_client: AsyncKeyrunesClient, http_mock
+    ) -> None:
+        """Test successful admin registration."""
+        http_mock.add_response(
+            "/api/register",
+            method="POST",
+            json={"user": {**OTHER_USER, "groups": ["admins"]}},
+        )
+
+        admin = asyncio.run(
+            async_http_client.register_admin(
+                username="otheruser",
+                email="other@example.com",
+                password="password123",
+                admin_key="secret-key",
+            )
+        )
+
+        assert admin.is_admin is True
+        assert b'"admin_key":"secret-key"' in http_mock.requests[0].content
+
+    def test_get_user(
+        self, async_http_client: AsyncKeyrunesClient, http_mock
+    ) -> None:
+        """Test fetching another user by ID."""
+        http_mock.add_response("/api/users/other", json=OTHER_USER)
+        async_http_client._token = "test-token"
+
+        user = asyncio.run(async_http_client.get_user("other"))
+
+        assert user.id == "other"
+        assert user.username == "otheruser"
+
+    def test_get_user_groups_for_user(
+        self, async_http_client: AsyncKeyrunesClient, http_mock
+    ) -> None:
+        """Test listing the groups of another user."""
+        http_mock.add_response("/api/users/other", json=OTHER_USER)
+        async_http_client._token = "test-token"
+
+        groups = asyncio.run(async_http_client.get_user_groups("other"))
+
+        assert groups == ["users", "developers"]
+
+    def test_has_groups(
+        self, async_http_client: AsyncKeyrunesClient, http_mock
+    ) -> None:
+        """Test checking several groups with a single user lookup."""
+        http_mock.add_response("/api/users/other", json=OTHER_USER)
+        async_http_client._token = "test-token"
+
+        result = asyncio.run(
+            async_http_client.has_groups("other", ["users", "admins"])
+        )
+
+        assert result == {"users": True, "admins": False}
+        assert len(http_mock.requests) == 1
+
+    def test_has_group_result_is_cached(self, base_url: str, http_mock) -> None:
+        """Test that group_cache_ttl reuses a membership result."""
+        http_mock.add_response(
+            "/api/users/other/groups/admins",
+            json={"user_id": "other", "group_id": "admins", "has_access": True},
+        )
+        client = AsyncKeyrunesClient(
+            base_url=base_url,
+            group_cache_ttl=30,
+            transport=httpx.MockTransport(http_mock),
+        )
+        client._token = "test-token"
+
+        async def run() -> list:
+            async with client:
+                return [await client.has_group("other", "admins") for _ in "ab"]
+
+        assert asyncio.run(run()) == [True, True]
+        assert len(http_mock.requests) == 1
+
+    def test_get_current_user_from_server(
+        self, async_http_client: AsyncKeyrunesClient, http_mock
+    ) -> None:
+        """Test the profile is fetched when the token carries no claims."""
+        http_mock.add_response("/api/users/me", json=OTHER_USER)
+        async_http_client._token = "test-token"
+
+        user = asyncio.run(async_http_client.get_current_user())
+
+        assert user.id == "other"
+
+    def test_login_user_reused_by_get_current_user(
+        self, async_http_client: AsyncKeyrunesClient, http_mock
+    ) -> None:
+        """Test the profile returned by login answers get_current_user."""
+        http_mock.add_response(
+            "/api/login",
+            method="POST",
+            json={
+                "token": "test-token",
+                "expires_in": 3600,
+                "user": OTHER_USER,
+            },
+        )
+
+        async def run() -> User:
+            await async_http_client.login("otheruser", "password123")
+            return await async_http_client.get_current_user()
+
+        assert asyncio.run(run()).id == "other"
+        assert len(http_mock.requests) == 1
+
+    def test_token_user_is_served_from_claims(
+        self, async_http_client: AsyncKeyrunesClient, http_mock
+    ) -> None:
+        """Test lookups for the token subject send no requests."""
+        async_http_client._token = "test-token"
+        async_http_client._token_data = TOKEN_CLAIMS
+
+        async def run() -> tuple:
+            return await asyncio.gather(
+                async_http_client.has_group("user123", "admins"),
+                async_http_client.get_user("user123"),
+                async_http_client.is_admin("user123"),
+                async_http_client.get_current_user(),
+            )
+
+        has_admins, user, is_admin, me = asyncio.run(run())
+
+        assert has_admins is True
+        assert user.username == "testuser"
+        assert is_admin is True
+        assert me.id == "user123"
+        assert http_mock.requests == []
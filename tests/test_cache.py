@@ -0,0 +1,99 @@
+"""Tests for Keyrunes SDK caching helpers."""
+
+from keyrunes_sdk.cache import TTLCache
+
+
+class FakeTimer:
+    """Manually advanced clock for deterministic expiry tests."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_set_and_get(self) -> None:
+        """Test storing and reading a value."""
+        cache: TTLCache[str, int] = TTLCache(ttl=30)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+        assert cache.get("missing", 0) == 0
+
+    def test_entry_expires(self) -> None:
+        """Test that entries are dropped after ttl."""
+        timer = FakeTimer()
+        cache: TTLCache[str, int] = TTLCache(ttl=10, timer=timer)
+        cache.set("a", 1)
+
+        timer.now = 9.9
+        assert cache.get("a") == 1
+
+        timer.now = 10.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_zero_ttl_skips_default_entries(self) -> None:
+        """Test that entries with a lifetime of 0 are not stored."""
+        cache: TTLCache[str, int] = TTLCache(ttl=0)
+        cache.set("a", 1)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_per_entry_ttl(self) -> None:
+        """Test that set() can override the lifetime of one entry."""
+        timer = FakeTimer()
+        cache: TTLCache[str, int] = TTLCache(ttl=0, timer=timer)
+        cache.set("a", 1, ttl=5)
+        cache.set("b", 2)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+        timer.now = 5.0
+        assert cache.get("a") is None
+
+    def test_evicts_oldest_when_full(self) -> None:
+        """Test that the oldest entry is evicted at maxsize."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=30)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_evicts_expired_before_oldest(self) -> None:
+        """Test that expired entries are evicted first."""
+        timer = FakeTimer()
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10, timer=timer)
+        cache.set("a", 1)
+        timer.now = 5
+        cache.set("b", 2)
+        timer.now = 12
+        cache.set("c", 3)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+    def test_discard_and_clear(self) -> None:
+        """Test explicit invalidation helpers."""
+        cache: TTLCache[tuple, bool] = TTLCache(ttl=30)
+        cache.set(("u1", "admins"), True)
+        cache.set(("u1", "users"), True)
+        cache.set(("u2", "users"), False)
+
+        cache.discard_where(lambda key: key[0] == "u1")
+        assert len(cache) == 1
+        assert cache.get(("u2", "users")) is False
+
+        cache.set(("u3", "users"), True)
+        cache.clear()
+        assert cache.get(("u3", "users")) is None
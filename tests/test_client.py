@@ -1,485 +1,731 @@
 """Tests for Keyrunes SDK client."""
 
-from unittest.mock import Mock, patch
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from unittest.mock import Mock
 
 import httpx
 import pytest
 
-from keyrunes_sdk.client import KeyrunesClient
+from keyrunes_sdk.client import (
+    DEFAULT_CONNECT_TIMEOUT,
+    KeyrunesClient,
+)
 from keyrunes_sdk.exceptions import (
     AuthenticationError,
     AuthorizationError,
+    GroupNotFoundError,
     NetworkError,
     UserNotFoundError,
 )
 from keyrunes_sdk.models import Token, User
 
 
-class TestKeyrunesClient:
-    """Tests for KeyrunesClient."""
+@pytest.fixture
+def lifecycle_client(base_url: str) -> Iterator[KeyrunesClient]:
+    """Return a client on a socket-free transport for lifecycle tests."""
+    client = KeyrunesClient(
+        base_url=base_url,
+        transport=httpx.MockTransport(lambda request: httpx.Response(200)),
+    )
+    yield client
+    client.close()
+
 
-    def test_init(self, base_url: str, api_key: str) -> None:
-        """Test client initialization."""
-        client = KeyrunesClient(base_url=base_url, api_key=api_key)
+# Tests for KeyrunesClient.
 
+
+def test_init(base_url: str, api_key: str) -> None:
+    """Test client initialization."""
+    with KeyrunesClient(base_url=base_url, api_key=api_key) as client:
         assert client.base_url == base_url
         assert client.api_key == api_key
         assert client.timeout == 30
         assert client._token is None
 
-    def test_init_strips_trailing_slash(self, api_key: str) -> None:
-        """Test that trailing slash is stripped from base URL."""
-        client = KeyrunesClient(
-            base_url="https://keyrunes.example.com/",
-            api_key=api_key,
-        )
 
+def test_init_strips_trailing_slash(api_key: str) -> None:
+    """Test that trailing slash is stripped from base URL."""
+    with KeyrunesClient(
+        base_url="https://keyrunes.example.com/",
+        api_key=api_key,
+    ) as client:
         assert client.base_url == "https://keyrunes.example.com"
 
-    def test_set_token(self, mock_client: KeyrunesClient) -> None:
-        """Test setting authentication token."""
-        token = "test-token-123"
-        mock_client.set_token(token)
-
-        assert mock_client._token == token
-
-    def test_clear_token(self, mock_client: KeyrunesClient) -> None:
-        """Test clearing authentication token."""
-        mock_client._token = "test-token"
-        mock_client.clear_token()
-
-        assert mock_client._token is None
-
-    def test_context_manager(self, base_url: str) -> None:
-        """Test using client as context manager."""
-        with KeyrunesClient(base_url=base_url) as client:
-            assert isinstance(client, KeyrunesClient)
-
-    @patch("keyrunes_sdk.client.httpx.Client.request")
-    def test_make_request_success(
-        self,
-        mock_request: Mock,
-        base_url: str,
-    ) -> None:
-        """Test successful API request."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"data": "test"}
-        mock_request.return_value = mock_response
-
-        client = KeyrunesClient(base_url=base_url)
-        result = client._make_request("GET", "/api/v1/test")
-
-        assert result == {"data": "test"}
-        mock_request.assert_called_once()
-
-    @patch("keyrunes_sdk.client.httpx.Client.request")
-    def test_make_request_authentication_error(
-        self,
-        mock_request: Mock,
-        base_url: str,
-    ) -> None:
-        """Test request with authentication error."""
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_request.return_value = mock_response
-
-        client = KeyrunesClient(base_url=base_url)
-
-        with pytest.raises(AuthenticationError):
-            client._make_request("GET", "/api/v1/test")
-
-    @patch("keyrunes_sdk.client.httpx.Client.request")
-    def test_make_request_authorization_error(
-        self,
-        mock_request: Mock,
-        base_url: str,
-    ) -> None:
-        """Test request with authorization error."""
-        mock_response = Mock()
-        mock_response.status_code = 403
-        mock_request.return_value = mock_response
-
-        client = KeyrunesClient(base_url=base_url)
-
-        with pytest.raises(AuthorizationError):
-            client._make_request("GET", "/api/v1/test")
-
-    @patch("keyrunes_sdk.client.httpx.Client.request")
-    def test_make_request_not_found_error(
-        self,
-        mock_request: Mock,
-        base_url: str,
-    ) -> None:
-        """Test request with not found error."""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_request.return_value = mock_response
-
-        client = KeyrunesClient(base_url=base_url)
-
-        with pytest.raises(UserNotFoundError):
-            client._make_request("GET", "/api/v1/test")
-
-    @patch("keyrunes_sdk.client.httpx.Client.request")
-    def test_make_request_network_error(
-        self,
-        mock_request: Mock,
-        base_url: str,
-    ) -> None:
-        """Test request with network error."""
-        mock_request.side_effect = httpx.RequestError("Network error")
-
-        client = KeyrunesClient(base_url=base_url)
-
-        with pytest.raises(NetworkError):
-            client._make_request("GET", "/api/v1/test")
-
-
-class TestClientAuthentication:
-    """Tests for authentication methods."""
-
-    def test_login_success(
-        self,
-        mock_client: KeyrunesClient,
-        sample_token: Token,
-    ) -> None:
-        """Test successful login."""
-        mock_client._make_request.return_value = sample_token.model_dump()
-
-        token = mock_client.login("testuser", "password123")
-
-        assert isinstance(token, Token)
-        assert token.access_token == sample_token.access_token
-        assert mock_client._token == sample_token.access_token
-
-    def test_login_sets_token(
-        self,
-        mock_client: KeyrunesClient,
-        sample_token: Token,
-    ) -> None:
-        """Test that login sets token automatically."""
-        mock_client._make_request.return_value = sample_token.model_dump()
-
-        mock_client.login("testuser", "password123")
-
-        assert mock_client._token == sample_token.access_token
-
-
-class TestClientUserManagement:
-    """Tests for user management methods."""
-
-    def test_register_user_success(
-        self,
-        mock_client: KeyrunesClient,
-        sample_user: User,
-    ) -> None:
-        """Test successful user registration."""
-        mock_client._make_request.return_value = {
-            "user": sample_user.model_dump()
-        }
-
-        user = mock_client.register_user(
-            username="newuser",
-            email="newuser@example.com",
-            password="password123",
-        )
 
-        assert isinstance(user, User)
-        assert user.username == sample_user.username
-        assert user.email == sample_user.email
-
-    def test_register_user_with_attributes(
-        self,
-        mock_client: KeyrunesClient,
-        sample_user: User,
-    ) -> None:
-        """Test user registration with attributes."""
-        mock_client._make_request.return_value = {
-            "user": sample_user.model_dump()
-        }
-
-        user = mock_client.register_user(
-            username="newuser",
-            email="newuser@example.com",
-            password="password123",
-            department="Engineering",
-            role="Developer",
-        )
+def test_init_builds_pooled_http_client(base_url: str) -> None:
+    """Test that a single pooled HTTP client is bound to base URL."""
+    with KeyrunesClient(base_url=base_url) as client:
+        assert str(client._client.base_url).rstrip("/") == base_url
+        assert client._client.timeout.connect == DEFAULT_CONNECT_TIMEOUT
+        assert client._client.timeout.read == 30
 
-        assert isinstance(user, User)
-        mock_client._make_request.assert_called_once()
-
-    def test_register_admin_success(
-        self,
-        mock_client: KeyrunesClient,
-        sample_admin: User,
-    ) -> None:
-        """Test successful admin registration."""
-        mock_client._make_request.return_value = {
-            "user": sample_admin.model_dump()
-        }
-
-        admin = mock_client.register_admin(
-            username="adminuser",
-            email="admin@example.com",
-            password="password123",
-            admin_key="secret-key",
-        )
 
-        assert isinstance(admin, User)
-        assert admin.is_admin is True
-
-    def test_register_user_normalizes_payload(self, base_url: str) -> None:
-        client = KeyrunesClient(base_url=base_url)
-        client._make_request = Mock(
-            return_value={
-                "user": {
-                    "id": "1",
-                    "username": "testuser",
-                    "email": "testuser@example.com",
-                    "groups": [],
-                }
-            }
-        )
+def test_each_client_builds_own_ssl_context(
+    base_url: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test every client gets an SSL context of its own, built once."""
+    built: List[Any] = []
+    original = httpx.create_ssl_context
 
-        user = client.register_user(
-            username="testuser",
-            email="testuser@example.com",
-            password="pass12345",
-        )
+    def create_ssl_context(*args: Any, **kwargs: Any) -> Any:
+        context = original(*args, **kwargs)
+        built.append(context)
+        return context
 
-        assert isinstance(user, User)
-        assert user.id == "1"
-
-    def test_register_admin_normalizes_payload(self, base_url: str) -> None:
-        client = KeyrunesClient(base_url=base_url)
-        client._make_request = Mock(
-            return_value={
-                "user": {
-                    "external_id": "abc",
-                    "username": "adminu",
-                    "email": "admin@example.com",
-                    "groups": ["admins"],
-                }
-            }
-        )
+    monkeypatch.setattr(httpx, "create_ssl_context", create_ssl_context)
+
+    KeyrunesClient(base_url=base_url).close()
+    KeyrunesClient(base_url=base_url).close()
+
+    assert len(built) == 2
+    assert built[0] is not built[1]
+
+
+def test_set_token(mock_client: KeyrunesClient) -> None:
+    """Test setting authentication token."""
+    token = "test-token-123"
+    mock_client.set_token(token)
+
+    assert mock_client._token == token
+
+
+def test_clear_token(mock_client: KeyrunesClient) -> None:
+    """Test clearing authentication token."""
+    mock_client._token = "test-token"
+    mock_client.clear_token()
+
+    assert mock_client._token is None
+
+
+def test_auth_headers_built_once_per_token(mock_client: KeyrunesClient) -> None:
+    """Test that the Authorization header is reused until cleared."""
+    mock_client.set_token("test-token-123")
+    headers = mock_client._request_headers(use_auth=True)
+
+    assert headers == {"Authorization": "Bearer test-token-123"}
+    assert mock_client._request_headers(use_auth=True) is headers
+    assert mock_client._request_headers(use_auth=False) == {}
+
+    options = mock_client._request_options({"a": 1}, None, True)
+    assert options["headers"]["Content-Type"] == "application/json"
+    assert headers == {"Authorization": "Bearer test-token-123"}
+
+    mock_client.clear_token()
+    assert mock_client._request_headers(use_auth=True) == {}
+
+
+def test_auth_headers_follow_assigned_token(
+    mock_client: KeyrunesClient,
+) -> None:
+    """Test that assigning _token directly never sends a stale header."""
+    mock_client.set_token("first-token")
+    mock_client._request_headers(use_auth=True)
+
+    mock_client._token = "second-token"
+    assert mock_client._request_headers(use_auth=True) == {
+        "Authorization": "Bearer second-token"
+    }
+
+    mock_client._token = None
+    assert mock_client._request_headers(use_auth=True) == {}
+
+
+def test_context_manager(lifecycle_client: KeyrunesClient) -> None:
+    """Test using client as context manager."""
+    with lifecycle_client as client:
+        assert client is lifecycle_client
+        assert not client._client.is_closed
 
-        admin = client.register_admin(
-            username="adminu",
-            email="admin@example.com",
-            password="pass12345",
-            admin_key="key",
+    assert lifecycle_client._client.is_closed
+
+
+def test_make_request_success(http_client: KeyrunesClient, http_mock) -> None:
+    """Test successful API request."""
+    http_mock.add_response("/api/v1/test", json={"data": "test"})
+
+    result = http_client._make_request("GET", "/api/v1/test")
+
+    assert result == {"data": "test"}
+    assert len(http_mock.requests) == 1
+
+
+def test_make_request_encodes_json_body(
+    http_client: KeyrunesClient, http_mock
+) -> None:
+    """Test that request bodies are sent as pre-encoded JSON."""
+    http_mock.add_response("/api/login", method="POST", json={})
+
+    http_client._make_request("POST", "/api/login", data={"identity": "a"})
+
+    request = http_mock.requests[0]
+    assert request.content == b'{"identity":"a"}'
+    assert request.headers["Content-Type"] == "application/json"
+
+
+@pytest.mark.parametrize(
+    "status_code, error",
+    [
+        (401, AuthenticationError),
+        (403, AuthorizationError),
+        (404, UserNotFoundError),
+        (500, NetworkError),
+    ],
+)
+def test_make_request_status_errors(
+    http_client: KeyrunesClient, http_mock, status_code: int, error: type
+) -> None:
+    """Test that error statuses map to the matching SDK exception."""
+    http_mock.add_response("/api/v1/test", status_code=status_code)
+
+    with pytest.raises(error):
+        http_client._make_request("GET", "/api/v1/test")
+
+
+def test_make_request_network_error(
+    http_client: KeyrunesClient, http_mock
+) -> None:
+    """Test request with network error."""
+    http_mock.add_exception("/api/v1/test", httpx.ConnectError("Network error"))
+
+    with pytest.raises(NetworkError):
+        http_client._make_request("GET", "/api/v1/test")
+
+
+def test_make_request_joins_inflight_get(base_url: str) -> None:
+    """Test that a concurrent identical GET waits for the first one."""
+    with KeyrunesClient(base_url=base_url) as client:
+        client._send_request = Mock()
+        pending: Future = Future()
+        client._inflight[("/api/v1/test", (), None)] = pending
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            follower = executor.submit(
+                client._make_request, "GET", "/api/v1/test"
+            )
+            pending.set_result({"data": "test"})
+
+            assert follower.result(timeout=5) == {"data": "test"}
+
+        client._send_request.assert_not_called()
+
+
+def test_make_request_clears_inflight_entry(
+    http_client: KeyrunesClient, http_mock
+) -> None:
+    """Test that sequential GETs are not served from a stale entry."""
+    http_mock.add_response("/api/v1/test", json={"data": "test"})
+
+    http_client._make_request("GET", "/api/v1/test")
+    http_client._make_request("GET", "/api/v1/test")
+
+    assert len(http_mock.requests) == 2
+    assert http_client._inflight == {}
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{"group": ["admins", "users"]}, {"filter": {"active": True}}],
+)
+def test_make_request_unhashable_params(
+    http_client: KeyrunesClient, http_mock, params: Dict[str, Any]
+) -> None:
+    """Test that list or dict query parameters do not break coalescing."""
+    http_mock.add_response("/api/v1/test", json={"data": "test"})
+
+    result = http_client._make_request("GET", "/api/v1/test", params=params)
+
+    assert result == {"data": "test"}
+    assert http_client._inflight == {}
+
+
+def test_inflight_key_normalizes_list_params(
+    http_client: KeyrunesClient,
+) -> None:
+    """Test that list-valued parameters share a key with tuple values."""
+    key = http_client._inflight_key(
+        "GET", "/api/v1/test", None, {"group": ["admins"]}, True
+    )
+
+    assert key == ("/api/v1/test", (("group", ("admins",)),), None)
+    assert (
+        http_client._inflight_key(
+            "GET", "/api/v1/test", None, {"filter": {}}, True
         )
+        is None
+    )
+
+
+# Tests for authentication methods.
+
 
-        assert isinstance(admin, User)
-        assert admin.id == "abc"
-        assert admin.is_admin is True
-
-    def test_get_user(
-        self,
-        mock_client: KeyrunesClient,
-        sample_user: User,
-    ) -> None:
-        """Test getting user by ID."""
-        mock_client._token = "test-token"
-        mock_client._token_data = {
-            "sub": "user123",
-            "username": "testuser",
-            "email": "testuser@example.com",
-            "groups": [],
-        }
-        mock_client._make_request.return_value = sample_user.model_dump()
-
-        user = mock_client.get_user("user123")
-
-        assert isinstance(user, User)
-        assert user.id == sample_user.id
-
-    def test_get_current_user(
-        self,
-        mock_client: KeyrunesClient,
-        sample_user: User,
-    ) -> None:
-        """Test getting current authenticated user."""
-        mock_client._token = "test-token"
-        mock_client._token_data = {
-            "sub": "user123",
-            "username": sample_user.username,
-            "email": sample_user.email,
-            "groups": sample_user.groups,
-        }
-
-        user = mock_client.get_current_user()
-
-        assert isinstance(user, User)
-        assert user.id == "user123"
-        assert user.username == sample_user.username
-
-    def test_normalize_user_external_id(self, base_url: str) -> None:
-        client = KeyrunesClient(base_url=base_url)
-        data = {
-            "external_id": "ext-1",
-            "username": "user",
-            "email": "user@example.com",
-            "groups": ["admins"],
-        }
-
-        user = client._normalize_user(data)
-
-        assert user.id == "ext-1"
-        assert user.is_admin is True
-
-    def test_parse_token_response_token_key(
-        self, base_url: str, sample_user: User
-    ) -> None:
-        client = KeyrunesClient(base_url=base_url)
-        payload = {
-            "token": "abc",
+def test_login_success(
+    mock_client: KeyrunesClient,
+    sample_token: Token,
+    sample_token_dict: Dict[str, Any],
+) -> None:
+    """Test successful login."""
+    mock_client._make_request.result = sample_token_dict
+
+    token = mock_client.login("testuser", "password123")
+
+    assert isinstance(token, Token)
+    assert token.access_token == sample_token.access_token
+    assert mock_client._token == sample_token.access_token
+
+
+def test_login_sets_token(
+    mock_client: KeyrunesClient,
+    sample_token: Token,
+    sample_token_dict: Dict[str, Any],
+) -> None:
+    """Test that login sets token automatically."""
+    mock_client._make_request.result = sample_token_dict
+
+    mock_client.login("testuser", "password123")
+
+    assert mock_client._token == sample_token.access_token
+
+
+def test_login_user_reused_by_get_current_user(
+    mock_client: KeyrunesClient,
+    sample_token: Token,
+    sample_token_dict: Dict[str, Any],
+) -> None:
+    """Test that the login profile short-circuits get_current_user."""
+    mock_client._make_request.result = sample_token_dict
+    mock_client.login("testuser", "password123")
+
+    user = mock_client.get_current_user()
+
+    assert user == sample_token.user
+    assert len(mock_client._make_request.calls) == 1
+
+
+def test_login_user_expires_with_token(
+    mock_client: KeyrunesClient,
+    sample_token: Token,
+    sample_token_dict: Dict[str, Any],
+    sample_user_dict: Dict[str, Any],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the login profile is dropped once the token expires."""
+    now = 1000.0
+    clock = SimpleNamespace(monotonic=lambda: now)
+    monkeypatch.setattr("keyrunes_sdk.client.time", clock)
+    mock_client._make_request.result = sample_token_dict
+    mock_client.login("testuser", "password123")
+
+    now += sample_token.expires_in
+    mock_client._make_request.result = sample_user_dict
+    mock_client.get_current_user()
+
+    assert mock_client._make_request.calls[-1] == (
+        ("GET", "/api/users/me"),
+        {},
+    )
+
+
+def test_clear_token_drops_login_user(
+    mock_client: KeyrunesClient,
+    sample_token_dict: Dict[str, Any],
+) -> None:
+    """Test that clearing the token forgets the login profile."""
+    mock_client._make_request.result = sample_token_dict
+    mock_client.login("testuser", "password123")
+    mock_client.clear_token()
+
+    with pytest.raises(AuthenticationError):
+        mock_client.get_current_user()
+
+
+# Tests for user management methods.
+
+
+def test_register_user_success(
+    mock_client: KeyrunesClient,
+    sample_user: User,
+    sample_user_response: Dict[str, Any],
+) -> None:
+    """Test successful user registration."""
+    mock_client._make_request.result = sample_user_response
+
+    user = mock_client.register_user(
+        username="newuser",
+        email="newuser@example.com",
+        password="password123",
+    )
+
+    assert isinstance(user, User)
+    assert user.username == sample_user.username
+    assert user.email == sample_user.email
+
+
+def test_register_user_with_attributes(
+    mock_client: KeyrunesClient,
+    sample_user_response: Dict[str, Any],
+) -> None:
+    """Test user registration with attributes."""
+    mock_client._make_request.result = sample_user_response
+
+    user = mock_client.register_user(
+        username="newuser",
+        email="newuser@example.com",
+        password="password123",
+        department="Engineering",
+        role="Developer",
+    )
+
+    assert isinstance(user, User)
+    assert len(mock_client._make_request.calls) == 1
+
+
+def test_register_admin_success(
+    mock_client: KeyrunesClient,
+    sample_admin_response: Dict[str, Any],
+) -> None:
+    """Test successful admin registration."""
+    mock_client._make_request.result = sample_admin_response
+
+    admin = mock_client.register_admin(
+        username="adminuser",
+        email="admin@example.com",
+        password="password123",
+        admin_key="secret-key",
+    )
+
+    assert isinstance(admin, User)
+    assert admin.is_admin is True
+
+
+def test_register_user_normalizes_payload(
+    client: KeyrunesClient, stub_request: Callable[..., Any]
+) -> None:
+    stub_request(
+        client,
+        {
             "user": {
-                "id": sample_user.id,
-                "username": sample_user.username,
-                "email": sample_user.email,
-                "groups": sample_user.groups,
-            },
-        }
-
-        token = client._parse_token_response(payload)
-
-        assert token.access_token == "abc"
-        assert token.user is not None
-        assert token.user.id == sample_user.id
-
-    def test_parse_token_response_access_token(
-        self, base_url: str, sample_user: User
-    ) -> None:
-        client = KeyrunesClient(base_url=base_url)
-        payload = {
-            "access_token": "xyz",
-            "token_type": "bearer",
-            "expires_in": 1000,
+                "id": "1",
+                "username": "testuser",
+                "email": "testuser@example.com",
+                "groups": [],
+            }
+        },
+    )
+
+    user = client.register_user(
+        username="testuser",
+        email="testuser@example.com",
+        password="pass12345",
+    )
+
+    assert isinstance(user, User)
+    assert user.id == "1"
+
+
+def test_register_admin_normalizes_payload(
+    client: KeyrunesClient, stub_request: Callable[..., Any]
+) -> None:
+    stub_request(
+        client,
+        {
             "user": {
-                "id": sample_user.id,
-                "username": sample_user.username,
-                "email": sample_user.email,
-                "groups": sample_user.groups,
-            },
-        }
+                "external_id": "abc",
+                "username": "adminu",
+                "email": "admin@example.com",
+                "groups": ["admins"],
+            }
+        },
+    )
+
+    admin = client.register_admin(
+        username="adminu",
+        email="admin@example.com",
+        password="pass12345",
+        admin_key="key",
+    )
+
+    assert isinstance(admin, User)
+    assert admin.id == "abc"
+    assert admin.is_admin is True
+
+
+def test_get_user(
+    mock_client: KeyrunesClient,
+    sample_user: User,
+    sample_user_dict: Dict[str, Any],
+) -> None:
+    """Test getting user by ID."""
+    mock_client._token = "test-token"
+    mock_client._make_request.result = sample_user_dict
+
+    user = mock_client.get_user("user123")
+
+    assert isinstance(user, User)
+    assert user.id == sample_user.id
+
+
+def test_is_admin_looks_up_other_user(
+    mock_client: KeyrunesClient,
+    sample_admin_dict: Dict[str, Any],
+) -> None:
+    """Test is_admin fetches users other than the token subject."""
+    mock_client._token = "test-token"
+    mock_client._make_request.result = sample_admin_dict
+
+    assert mock_client.is_admin("admin123") is True
+    assert len(mock_client._make_request.calls) == 1
+
+
+def test_is_admin_token_user_skips_request(mock_client: KeyrunesClient) -> None:
+    """Test is_admin answers for the token subject from its groups."""
+    mock_client._token = "test-token"
+    mock_client._token_data = {"sub": "user123", "groups": ["users"]}
+
+    assert mock_client.is_admin("user123") is False
+    assert mock_client._make_request.calls == []
+
+
+def test_get_current_user(
+    mock_client: KeyrunesClient,
+    sample_user: User,
+) -> None:
+    """Test getting current authenticated user."""
+    mock_client._token = "test-token"
+    mock_client._token_data = {
+        "sub": "user123",
+        "username": sample_user.username,
+        "email": sample_user.email,
+        "groups": sample_user.groups,
+    }
+
+    user = mock_client.get_current_user()
+
+    assert isinstance(user, User)
+    assert user.id == "user123"
+    assert user.username == sample_user.username
+
+
+def test_normalize_user_external_id(client: KeyrunesClient) -> None:
+    data = {
+        "external_id": "ext-1",
+        "username": "user",
+        "email": "user@example.com",
+        "groups": ["admins"],
+    }
+
+    user = client._normalize_user(data)
+
+    assert user.id == "ext-1"
+    assert user.is_admin is True
+
+
+@pytest.mark.parametrize(
+    "token_fields, access_token, expires_in",
+    [
+        ({"token": "abc"}, "abc", None),
+        (
+            {"access_token": "xyz", "token_type": "bearer", "expires_in": 1000},
+            "xyz",
+            1000,
+        ),
+    ],
+    ids=["token_key", "access_token"],
+)
+def test_parse_token_response(
+    client: KeyrunesClient,
+    sample_user_dict: Dict[str, Any],
+    token_fields: Dict[str, Any],
+    access_token: str,
+    expires_in: Optional[int],
+) -> None:
+    """Test parsing both the current and the legacy token payloads."""
+    payload = {**token_fields, "user": sample_user_dict}
+
+    token = client._parse_token_response(payload)
+
+    assert token.access_token == access_token
+    assert token.token_type == "bearer"
+    assert token.expires_in == expires_in
+    assert token.user is not None
+    assert token.user.id == sample_user_dict["id"]
+
+
+# Tests for group management methods.
+
+
+def test_has_group_true(mock_client: KeyrunesClient) -> None:
+    """Test checking group membership - user has group."""
+    mock_client._token = "test-token"
+    mock_client._make_request.result = {
+        "user_id": "user123",
+        "group_id": "admins",
+        "has_access": True,
+    }
+
+    result = mock_client.has_group("user123", "admins")
+
+    assert result is True
+
+
+def test_has_group_false(mock_client: KeyrunesClient) -> None:
+    """Test checking group membership - user doesn't have group."""
+    mock_client._token = "test-token"
+    mock_client._make_request.result = {
+        "user_id": "user123",
+        "group_id": "admins",
+        "has_access": False,
+    }
 
-        token = client._parse_token_response(payload)
+    result = mock_client.has_group("user123", "admins")
 
-        assert token.access_token == "xyz"
-        assert token.token_type == "bearer"
+    assert result is False
 
 
-class TestClientGroupManagement:
-    """Tests for group management methods."""
+def test_has_group_not_found(mock_client: KeyrunesClient) -> None:
+    """Test checking non-existent group."""
+    mock_client._token = "test-token"
+    mock_client._make_request.error = UserNotFoundError("Not found")
 
-    def test_has_group_true(self, mock_client: KeyrunesClient) -> None:
-        """Test checking group membership - user has group."""
-        mock_client._token = "test-token"
-        mock_client._token_data = {
-            "sub": "user123",
-            "username": "testuser",
-            "email": "testuser@example.com",
-            "groups": ["admins"],
-        }
-        mock_client._make_request.return_value = {
-            "user_id": "user123",
+    with pytest.raises(GroupNotFoundError):
+        mock_client.has_group("user123", "nonexistent")
+
+
+def test_has_group_token_user_skips_request(
+    mock_client: KeyrunesClient,
+) -> None:
+    """Test that the token subject is answered from the token's groups."""
+    mock_client._token = "test-token"
+    mock_client._token_data = {"sub": "user123", "groups": ["admins"]}
+
+    assert mock_client.has_group("user123", "admins") is True
+    assert mock_client.has_group("user123", "nonexistent") is False
+    assert mock_client._make_request.calls == []
+
+
+@pytest.fixture
+def caching_client(
+    base_url: str, stub_request: Callable[..., Any]
+) -> Iterator[KeyrunesClient]:
+    """Return a client that caches group membership for 30 seconds."""
+    client = KeyrunesClient(base_url=base_url, group_cache_ttl=30)
+    client._token = "test-token"
+    stub_request(
+        client,
+        {
+            "user_id": "other",
             "group_id": "admins",
             "has_access": True,
-        }
-
-        result = mock_client.has_group("user123", "admins")
-
-        assert result is True
-
-    def test_has_group_false(self, mock_client: KeyrunesClient) -> None:
-        """Test checking group membership - user doesn't have group."""
-        mock_client._token = "test-token"
-        mock_client._token_data = {
-            "sub": "user123",
-            "username": "testuser",
-            "email": "testuser@example.com",
-            "groups": [],
-        }
-        mock_client._make_request.return_value = {
-            "user_id": "user123",
-            "group_id": "admins",
-            "has_access": False,
-        }
-
-        result = mock_client.has_group("user123", "admins")
-
-        assert result is False
-
-    def test_has_group_not_found(self, mock_client: KeyrunesClient) -> None:
-        """Test checking non-existent group."""
-        mock_client._token = "test-token"
-        mock_client._token_data = {
-            "sub": "user123",
-            "username": "testuser",
-            "email": "testuser@example.com",
-            "groups": [],
-        }
-        mock_client._make_request.side_effect = UserNotFoundError("Not found")
-
-        result = mock_client.has_group("user123", "nonexistent")
-        assert result is False
-
-    def test_get_user_groups(
-        self,
-        mock_client: KeyrunesClient,
-        sample_user: User,
-    ) -> None:
-        """Test getting user groups."""
-        mock_client._token = "test-token"
-        mock_client._token_data = {
-            "sub": "user123",
-            "username": "testuser",
-            "email": "testuser@example.com",
-            "groups": sample_user.groups,
-        }
-        mock_client._make_request.return_value = sample_user.model_dump()
-
-        groups = mock_client.get_user_groups("user123")
-
-        assert isinstance(groups, list)
-        assert groups == sample_user.groups
-
-    def test_get_user_groups_current_user(
-        self,
-        mock_client: KeyrunesClient,
-        sample_user: User,
-    ) -> None:
-        """Test getting current user's groups."""
-        mock_client._token = "test-token"
-        mock_client._token_data = {
-            "sub": "user123",
-            "username": "testuser",
-            "email": "testuser@example.com",
-            "groups": sample_user.groups,
-        }
-
-        groups = mock_client.get_user_groups()
-
-        assert isinstance(groups, list)
-        assert groups == sample_user.groups
-
-
-class TestClientEdgeCases:
-    """Tests for edge cases and error handling."""
-
-    def test_login_with_empty_credentials(
-        self, mock_client: KeyrunesClient
-    ) -> None:
-        """Test login with empty credentials."""
-        with pytest.raises(Exception):
-            mock_client.login("", "")
-
-    def test_client_close(self, base_url: str) -> None:
-        """Test closing client."""
-        client = KeyrunesClient(base_url=base_url)
-        client.close()
-
-        assert client._client is not None
+        },
+    )
+    yield client
+    client.close()
+
+
+def test_has_group_result_is_cached(caching_client: KeyrunesClient) -> None:
+    """Test that repeated checks for another user hit the cache."""
+    assert caching_client.has_group("other", "admins") is True
+    assert caching_client.has_group("other", "admins") is True
+
+    assert len(caching_client._make_request.calls) == 1
+
+
+def test_invalidate_user_clears_cached_groups(
+    caching_client: KeyrunesClient,
+) -> None:
+    """Test that invalidate_user forces a new membership request."""
+    caching_client.has_group("other", "admins")
+    caching_client.invalidate_user("other")
+    caching_client.has_group("other", "admins")
+
+    assert len(caching_client._make_request.calls) == 2
+
+
+def test_has_group_cache_disabled_by_default(
+    base_url: str, stub_request: Callable[..., Any]
+) -> None:
+    """Test that membership is not cached unless group_cache_ttl is set."""
+    with KeyrunesClient(base_url=base_url) as client:
+        client._token = "test-token"
+        stub = stub_request(
+            client,
+            {
+                "user_id": "other",
+                "group_id": "admins",
+                "has_access": False,
+            },
+        )
+
+        client.has_group("other", "admins")
+        client.has_group("other", "admins")
+
+    assert len(stub.calls) == 2
+
+
+def test_has_groups_single_lookup(
+    mock_client: KeyrunesClient,
+    sample_user_dict: Dict[str, Any],
+) -> None:
+    """Test checking several groups with one request."""
+    mock_client._token = "test-token"
+    mock_client._make_request.result = sample_user_dict
+
+    result = mock_client.has_groups("user123", ["users", "admins"])
+
+    assert result == {"users": True, "admins": False}
+    assert mock_client._make_request.calls == [
+        (("GET", "/api/users/user123"), {})
+    ]
+
+
+def test_get_user_groups(
+    mock_client: KeyrunesClient,
+    sample_user: User,
+    sample_user_dict: Dict[str, Any],
+) -> None:
+    """Test getting user groups."""
+    mock_client._token = "test-token"
+    mock_client._make_request.result = sample_user_dict
+
+    groups = mock_client.get_user_groups("user123")
+
+    assert isinstance(groups, list)
+    assert groups == sample_user.groups
+
+
+def test_get_user_groups_current_user(
+    mock_client: KeyrunesClient,
+    sample_user: User,
+) -> None:
+    """Test getting current user's groups."""
+    mock_client._token = "test-token"
+    mock_client._token_data = {
+        "sub": "user123",
+        "username": "testuser",
+        "email": "testuser@example.com",
+        "groups": sample_user.groups,
+    }
+
+    groups = mock_client.get_user_groups()
+
+    assert isinstance(groups, list)
+    assert groups == sample_user.groups
+
+
+# Tests for edge cases and error handling.
+
+
+def test_login_with_empty_credentials(mock_client: KeyrunesClient) -> None:
+    """Test login with empty credentials."""
+    with pytest.raises(ValueError, match="credentials"):
+        mock_client.login("", "")
+
+    assert mock_client._make_request.calls == []
+
+
+def test_client_close(lifecycle_client: KeyrunesClient) -> None:
+    """Test closing client."""
+    lifecycle_client.close()
+
+    assert lifecycle_client._client.is_closed
@@ -1,53 +1,315 @@
 """Tests for Keyrunes SDK decorators."""
 
-from unittest.mock import MagicMock
-
+import asyncio
+import inspect
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+from unittest.mock import patch
+
+import httpx
 import pytest
 
+from keyrunes_sdk.async_client import AsyncKeyrunesClient
+from keyrunes_sdk.client import KeyrunesClient
 from keyrunes_sdk.decorators import require_admin, require_group
-from keyrunes_sdk.exceptions import AuthorizationError
-from tests.factories import AdminUserFactory, UserFactory
+from keyrunes_sdk.exceptions import (
+    AuthenticationError,
+    AuthorizationError,
+    UserNotFoundError,
+)
+from keyrunes_sdk.models import User
+from tests.factories import make_user
+
+
+def _act(user_id: str, client: Optional[KeyrunesClient] = None) -> str:
+    return f"Action for {user_id}"
+
+
+def _act_on_target(
+    target_user: str, client: Optional[KeyrunesClient] = None
+) -> str:
+    return f"Action for {target_user}"
+
+
+ACTIONS_BY_PARAM = {"user_id": _act, "target_user": _act_on_target}
+
+
+_CLIENT: ContextVar[Optional[KeyrunesClient]] = ContextVar(
+    "_CLIENT", default=None
+)
+
+
+@contextmanager
+def _using(client: KeyrunesClient) -> Iterator[None]:
+    token = _CLIENT.set(client)
+    try:
+        yield
+    finally:
+        _CLIENT.reset(token)
+
+
+# Decorated once at import; each test supplies its client through _CLIENT.
+@require_group("admins", client_getter=_CLIENT.get)
+def _admin_group_action(user_id: str) -> str:
+    return f"Admin action for {user_id}"
+
+
+@require_admin(client_getter=_CLIENT.get)
+def _admin_action(user_id: str) -> str:
+    return f"Admin action for {user_id}"
+
+
+USER_ID_LOOKUPS = [
+    pytest.param(
+        lambda c, param: require_group("admins", client=c, user_id_param=param),
+        "has_group",
+        ("user123", "admins"),
+        id="group",
+    ),
+    pytest.param(
+        lambda c, param: require_admin(client=c, user_id_param=param),
+        "is_admin",
+        ("user123",),
+        id="admin",
+    ),
+]
+
+ACCESS_DENIED = [
+    pytest.param(
+        lambda c: require_group("admins", client=c),
+        "has_group",
+        lambda: False,
+        "does not belong to any of the required groups",
+        id="group",
+    ),
+    pytest.param(
+        lambda c: require_admin(client=c),
+        "is_admin",
+        lambda: False,
+        "does not have admin privileges",
+        id="admin",
+    ),
+]
+
+DECORATORS_WITH_CLIENT = [
+    pytest.param(lambda c: require_group("admins", client=c), id="group"),
+    pytest.param(lambda c: require_admin(client=c), id="admin"),
+]
+
+ADMINS_GRANTED = {
+    "user_id": "user123",
+    "group_id": "admins",
+    "has_access": True,
+}
+
+DECORATORS_WITHOUT_CLIENT = [
+    pytest.param(lambda: require_group("admins"), id="group"),
+    pytest.param(lambda: require_admin(), id="admin"),
+]
+
+
+class TestDecoratorAccessChecks:
+    """Table-driven tests shared by require_group and require_admin."""
+
+    @pytest.mark.parametrize("source", ["positional", "kwarg", "client_kwarg"])
+    @pytest.mark.parametrize("param_name", ["user_id", "target_user"])
+    @pytest.mark.parametrize(
+        "decorator_factory, client_method, expected_call",
+        USER_ID_LOOKUPS,
+    )
+    def test_access_granted(
+        self,
+        spec_client,
+        decorator_factory,
+        client_method,
+        expected_call,
+        param_name,
+        source,
+    ) -> None:
+        """Test decorators find the user ID and client wherever passed."""
+        client = spec_client
+        func = ACTIONS_BY_PARAM[param_name]
+
+        if source == "client_kwarg":
+            decorated = decorator_factory(None, param_name)(func)
+            result = decorated(**{param_name: "user123"}, client=client)
+        else:
+            decorated = decorator_factory(client, param_name)(func)
+            if source == "positional":
+                result = decorated("user123")
+            else:
+                result = decorated(**{param_name: "user123"})
+
+        assert result == "Action for user123"
+        getattr(client, client_method).assert_called_once_with(*expected_call)
+
+    @pytest.mark.parametrize(
+        "decorator_factory, client_method, make_result, message",
+        ACCESS_DENIED,
+    )
+    def test_access_denied(
+        self,
+        spec_client,
+        decorator_factory,
+        client_method,
+        make_result,
+        message,
+    ) -> None:
+        """Test decorators deny access when the check fails."""
+        getattr(spec_client, client_method).return_value = make_result()
 
+        with pytest.raises(AuthorizationError, match=message):
+            decorator_factory(spec_client)(_act)(user_id="user123")
 
-class TestRequireGroupDecorator:
-    """Tests for require_group decorator."""
+    @pytest.mark.parametrize("source", ["decorator", "kwarg", "global"])
+    @pytest.mark.parametrize("decorator_factory", DECORATORS_WITH_CLIENT)
+    def test_async_client_rejected(
+        self, base_url, decorator_factory, source
+    ) -> None:
+        """Test an async client is refused instead of granting access."""
+
+        def deny(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                json={
+                    "id": "user123",
+                    "username": "user",
+                    "email": "user@example.com",
+                    "has_access": False,
+                    "is_admin": False,
+                },
+            )
+
+        async_client = AsyncKeyrunesClient(
+            base_url=base_url, transport=httpx.MockTransport(deny)
+        )
+        async_client.set_token("test-token")
+        calls = []
 
-    def test_require_group_user_has_access(self, mock_client) -> None:
-        """Test decorator allows access when user has group."""
-        mock_client.has_group = MagicMock(return_value=True)
+        def action(user_id: str, client=None) -> str:
+            calls.append(user_id)
+            return "GRANTED"
+
+        kwargs = {}
+        if source == "decorator":
+            decorated = decorator_factory(async_client)(action)
+        else:
+            decorated = decorator_factory(None)(action)
+        if source == "kwarg":
+            kwargs = {"client": async_client}
+        global_client = async_client if source == "global" else None
+
+        with patch(
+            "keyrunes_sdk.decorators.get_global_client",
+            return_value=global_client,
+        ):
+            with pytest.raises(TypeError, match="synchronous KeyrunesClient"):
+                decorated(user_id="user123", **kwargs)
+        asyncio.run(async_client.close())
+
+        assert calls == []
+
+    def test_duck_typed_client_accepted(self) -> None:
+        """Test a client that only implements has_group is still used."""
+
+        class GroupOnlyClient:
+            def __init__(self) -> None:
+                self.calls = []
+
+            def has_group(self, user_id: str, group_id: str) -> bool:
+                self.calls.append((user_id, group_id))
+                return True
+
+        duck_client = GroupOnlyClient()
+        action = require_group("admins", client=duck_client, cache_ttl=60)(_act)
+
+        assert action(user_id="user123") == "Action for user123"
+        assert action(user_id="user123") == "Action for user123"
+        assert duck_client.calls == [("user123", "admins")] * 2
+
+    @pytest.mark.parametrize("decorator_factory", DECORATORS_WITHOUT_CLIENT)
+    def test_no_client_provided(self, decorator_factory) -> None:
+        """Test decorators raise an error when no client is available."""
+        action = decorator_factory()(_act)
+
+        with pytest.raises(ValueError, match="KeyrunesClient not provided"):
+            action(user_id="user123")
+
+    @pytest.mark.parametrize("decorator_factory", DECORATORS_WITH_CLIENT)
+    def test_no_user_id(self, spec_client, decorator_factory) -> None:
+        """Test decorators raise an error when the user ID is missing."""
+
+        @decorator_factory(spec_client)
+        def action() -> str:
+            return "Action"
+
+        with pytest.raises(ValueError, match="User ID not found"):
+            action()
 
-        @require_group("admins", client=mock_client)
-        def admin_function(user_id: str) -> str:
-            return f"Admin action for {user_id}"
 
-        result = admin_function(user_id="user123")
+class TestClientGetter:
+    """Tests for decorators resolving their client via client_getter."""
+
+    def test_require_group_client_getter(self, spec_client) -> None:
+        """Test require_group uses the client returned by client_getter."""
+        with _using(spec_client):
+            result = _admin_group_action(user_id="user123")
 
         assert result == "Admin action for user123"
-        mock_client.has_group.assert_called_once_with("user123", "admins")
+        spec_client.has_group.assert_called_once_with("user123", "admins")
 
-    def test_require_group_user_no_access(self, mock_client) -> None:
-        """Test decorator denies access when user doesn't have group."""
-        mock_client.has_group = MagicMock(return_value=False)
+    def test_require_admin_client_getter(self, spec_client) -> None:
+        """Test require_admin uses the client returned by client_getter."""
+        with _using(spec_client):
+            result = _admin_action(user_id="admin123")
 
-        @require_group("admins", client=mock_client)
-        def admin_function(user_id: str) -> str:
-            return f"Admin action for {user_id}"
+        assert result == "Admin action for admin123"
+        spec_client.is_admin.assert_called_once_with("admin123")
 
-        with pytest.raises(AuthorizationError) as exc_info:
-            admin_function(user_id="user123")
+    def test_kwargs_client_takes_precedence(
+        self, spec_client, http_client, http_mock
+    ) -> None:
+        """Test a 'client' kwarg wins over client_getter."""
 
-        assert "does not belong to any of the required groups" in str(
-            exc_info.value
-        )
+        @require_group("admins", client_getter=_CLIENT.get)
+        def action(user_id: str, client) -> str:
+            return user_id
+
+        with _using(http_client):
+            action(user_id="user123", client=spec_client)
+
+        spec_client.has_group.assert_called_once()
+        assert http_mock.requests == []
+
+    def test_client_getter_async_client_rejected(self, base_url) -> None:
+        """Test a getter returning an async client is refused."""
+        async_client = AsyncKeyrunesClient(base_url=base_url)
+        async_client.set_token("test-token")
+
+        with _using(async_client):
+            with pytest.raises(TypeError, match="synchronous KeyrunesClient"):
+                _admin_group_action(user_id="user123")
+        asyncio.run(async_client.close())
 
-    def test_require_group_multiple_groups_any(self, mock_client) -> None:
+    def test_client_getter_returning_none(self) -> None:
+        """Test a getter returning None falls back to the global client."""
+        with pytest.raises(ValueError, match="KeyrunesClient not provided"):
+            _admin_group_action(user_id="user123")
+
+
+class TestRequireGroupDecorator:
+    """Tests for require_group decorator."""
+
+    def test_require_group_multiple_groups_any(self, spec_client) -> None:
         """Test decorator with multiple groups (ANY match)."""
-        mock_client.has_group = MagicMock(
-            side_effect=lambda uid, gid: gid == "moderators"
-        )
+        spec_client.has_group.side_effect = lambda uid, gid: gid == "moderators"
 
         @require_group(
-            "admins", "moderators", client=mock_client, all_groups=False
+            "admins",
+            "moderators",
+            client=spec_client,
+            all_groups=False,
         )
         def moderate_function(user_id: str) -> str:
             return f"Moderate action for {user_id}"
@@ -56,12 +318,11 @@ class TestRequireGroupDecorator:
 
         assert result == "Moderate action for user123"
 
-    def test_require_group_multiple_groups_all(self, mock_client) -> None:
+    def test_require_group_multiple_groups_all(self, spec_client) -> None:
         """Test decorator with multiple groups (ALL required)."""
-        mock_client.has_group = MagicMock(return_value=True)
 
         @require_group(
-            "admins", "verified", client=mock_client, all_groups=True
+            "admins", "verified", client=spec_client, all_groups=True
         )
         def sensitive_function(user_id: str) -> str:
             return f"Sensitive action for {user_id}"
@@ -69,198 +330,272 @@ class TestRequireGroupDecorator:
         result = sensitive_function(user_id="user123")
 
         assert result == "Sensitive action for user123"
-        assert mock_client.has_group.call_count == 2
+        assert spec_client.has_group.call_count == 2
 
     def test_require_group_multiple_groups_all_missing_one(
-        self, mock_client
+        self, spec_client
     ) -> None:
         """Test decorator with ALL groups required but user missing one."""
-        mock_client.has_group = MagicMock(
-            side_effect=lambda uid, gid: gid == "admins"
-        )
+        spec_client.has_group.side_effect = lambda uid, gid: gid == "admins"
 
         @require_group(
-            "admins", "verified", client=mock_client, all_groups=True
+            "admins", "verified", client=spec_client, all_groups=True
         )
         def sensitive_function(user_id: str) -> str:
             return f"Sensitive action for {user_id}"
 
-        with pytest.raises(AuthorizationError) as exc_info:
+        with pytest.raises(
+            AuthorizationError, match="does not have required group 'verified'"
+        ):
             sensitive_function(user_id="user123")
 
-        assert "does not have required group 'verified'" in str(exc_info.value)
+    def test_require_group_token_user_uses_token_groups(
+        self, http_client, http_mock
+    ) -> None:
+        """Test that the token subject is checked without has_group."""
+        http_client._token = "test-token"
+        http_client._token_data = {
+            "sub": "user123",
+            "groups": ["admins", "verified"],
+        }
 
-    def test_require_group_from_kwargs(self, mock_client) -> None:
-        """Test decorator gets client from kwargs."""
-        mock_client.has_group = MagicMock(return_value=True)
+        @require_group(
+            "admins", "verified", client=http_client, all_groups=True
+        )
+        def sensitive_function(user_id: str) -> str:
+            return f"Sensitive action for {user_id}"
 
-        @require_group("admins")
-        def admin_function(user_id: str, client) -> str:
-            return f"Admin action for {user_id}"
+        assert sensitive_function(user_id="user123") == (
+            "Sensitive action for user123"
+        )
+        assert http_mock.requests == []
 
-        result = admin_function(user_id="user123", client=mock_client)
+    def test_require_group_deduplicates_groups(self, spec_client) -> None:
+        """Test that repeated group IDs are only checked once."""
 
-        assert result == "Admin action for user123"
+        @require_group(
+            "admins",
+            "admins",
+            "verified",
+            client=spec_client,
+            all_groups=True,
+        )
+        def sensitive_function(user_id: str) -> str:
+            return user_id
+
+        sensitive_function(user_id="user123")
 
-    def test_require_group_no_client_provided(self) -> None:
-        """Test decorator raises error when no client provided."""
+        assert spec_client.has_group.call_count == 2
 
-        @require_group("admins")
+    @pytest.mark.parametrize("ttl", [0, 60])
+    def test_require_group_cached_second_call(self, spec_client, ttl) -> None:
+        """Test that a granted check is reused within cache_ttl."""
+
+        @require_group("admins", client=spec_client, cache_ttl=ttl)
         def admin_function(user_id: str) -> str:
-            return f"Admin action for {user_id}"
+            return user_id
 
-        with pytest.raises(ValueError) as exc_info:
-            admin_function(user_id="user123")
+        admin_function(user_id="user123")
+        admin_function(user_id="user123")
 
-        assert "KeyrunesClient not provided" in str(exc_info.value)
+        spec_client.has_group.assert_called_with("user123", "admins")
+        assert spec_client.has_group.call_count == (1 if ttl else 2)
 
-    def test_require_group_no_user_id(self, mock_client) -> None:
-        """Test decorator raises error when user_id not provided."""
+    def test_require_group_cache_skips_denials(self, spec_client) -> None:
+        """Test that denied checks are looked up again."""
+        spec_client.has_group.return_value = False
 
-        @require_group("admins", client=mock_client)
-        def admin_function() -> str:
-            return "Admin action"
+        @require_group("admins", client=spec_client, cache_ttl=60)
+        def admin_function(user_id: str) -> str:
+            return user_id
 
-        with pytest.raises(ValueError) as exc_info:
-            admin_function()
+        for _ in range(2):
+            with pytest.raises(AuthorizationError):
+                admin_function(user_id="user123")
 
-        assert "User ID not found" in str(exc_info.value)
+        assert spec_client.has_group.call_count == 2
 
-    def test_require_group_custom_user_id_param(self, mock_client) -> None:
-        """Test decorator with custom user_id parameter name."""
-        mock_client.has_group = MagicMock(return_value=True)
+    def test_require_group_cache_cleared_on_logout(
+        self, http_client, http_mock
+    ) -> None:
+        """Test a cached grant does not survive clear_token()."""
+        http_mock.add_response(
+            "/api/users/user123/groups/admins", json=ADMINS_GRANTED
+        )
+        http_client.set_token("test-token")
 
-        @require_group(
-            "admins", client=mock_client, user_id_param="target_user"
+        @require_group("admins", client=http_client, cache_ttl=60)
+        def admin_function(user_id: str) -> str:
+            return "GRANTED"
+
+        admin_function(user_id="user123")
+        http_client.clear_token()
+
+        with pytest.raises(AuthenticationError):
+            admin_function(user_id="user123")
+
+    @pytest.mark.parametrize(
+        "reset",
+        [
+            pytest.param(lambda c: c.set_token("other-token"), id="set_token"),
+            pytest.param(
+                lambda c: c.invalidate_user("user123"), id="invalidate_user"
+            ),
+        ],
+    )
+    def test_require_group_cache_rechecked_after_reset(
+        self, http_client, http_mock, reset
+    ) -> None:
+        """Test a new token or invalidate_user() forces a fresh check."""
+        http_mock.add_response(
+            "/api/users/user123/groups/admins", json=ADMINS_GRANTED
         )
-        def admin_function(target_user: str) -> str:
-            return f"Admin action for {target_user}"
+        http_client.set_token("test-token")
 
-        result = admin_function(target_user="user123")
+        @require_group("admins", client=http_client, cache_ttl=60)
+        def admin_function(user_id: str) -> str:
+            return "GRANTED"
 
-        assert result == "Admin action for user123"
-        mock_client.has_group.assert_called_once_with("user123", "admins")
+        admin_function(user_id="user123")
+        reset(http_client)
+        admin_function(user_id="user123")
+
+        assert len(http_mock.requests) == 2
 
-    def test_require_group_user_id_from_args(self, mock_client) -> None:
-        """Test decorator gets user_id from positional args."""
-        mock_client.has_group = MagicMock(return_value=True)
+    def test_require_group_inspects_signature_once(self, spec_client) -> None:
+        """Test signature introspection happens at decoration time only."""
 
-        @require_group("admins", client=mock_client)
-        def admin_function(user_id: str, action: str) -> str:
-            return f"{action} for {user_id}"
+        with patch(
+            "keyrunes_sdk.decorators.inspect.signature",
+            wraps=inspect.signature,
+        ) as signature:
 
-        result = admin_function("user123", "Delete")
+            @require_group("admins", client=spec_client)
+            def admin_function(user_id: str) -> str:
+                return user_id
 
-        assert result == "Delete for user123"
-        mock_client.has_group.assert_called_once_with("user123", "admins")
+            admin_function("user123")
+            admin_function("user456")
+
+        signature.assert_called_once()
 
 
 class TestRequireAdminDecorator:
     """Tests for require_admin decorator."""
 
-    def test_require_admin_user_is_admin(self, mock_client) -> None:
-        """Test decorator allows access for admin user."""
-        admin_user = AdminUserFactory()
-        mock_client.get_user = MagicMock(return_value=admin_user)
+    def test_require_admin_prefers_is_admin(self, spec_client) -> None:
+        """Test the admin check uses is_admin instead of fetching the user."""
 
-        @require_admin(client=mock_client)
+        @require_admin(client=spec_client)
         def admin_function(user_id: str) -> str:
-            return f"Admin action for {user_id}"
-
-        result = admin_function(user_id="admin123")
+            return user_id
 
-        assert result == "Admin action for admin123"
-        mock_client.get_user.assert_called_once_with("admin123")
-
-    def test_require_admin_user_not_admin(self, mock_client) -> None:
-        """Test decorator denies access for non-admin user."""
-        regular_user = UserFactory(is_admin=False)
-        mock_client.get_user = MagicMock(return_value=regular_user)
+        admin_function(user_id="admin123")
 
-        @require_admin(client=mock_client)
-        def admin_function(user_id: str) -> str:
-            return f"Admin action for {user_id}"
+        spec_client.is_admin.assert_called_once_with("admin123")
+        spec_client.get_user.assert_not_called()
 
-        with pytest.raises(AuthorizationError) as exc_info:
-            admin_function(user_id="user123")
+    @pytest.mark.parametrize(
+        "is_admin, granted", [(True, True), (False, False)]
+    )
+    def test_require_admin_falls_back_to_get_user(
+        self, is_admin, granted
+    ) -> None:
+        """Test clients without is_admin are checked through get_user."""
 
-        assert "does not have admin privileges" in str(exc_info.value)
+        class UserOnlyClient:
+            def __init__(self) -> None:
+                self.calls = []
 
-    def test_require_admin_from_kwargs(self, mock_client) -> None:
-        """Test decorator gets client from kwargs."""
-        admin_user = AdminUserFactory()
-        mock_client.get_user = MagicMock(return_value=admin_user)
+            def get_user(self, user_id: str) -> User:
+                self.calls.append(user_id)
+                return make_user(id=user_id, is_admin=is_admin)
 
-        @require_admin()
-        def admin_function(user_id: str, client) -> str:
-            return f"Admin action for {user_id}"
+        user_client = UserOnlyClient()
 
-        result = admin_function(user_id="admin123", client=mock_client)
+        @require_admin(client=user_client)
+        def admin_function(user_id: str) -> str:
+            return "GRANTED"
 
-        assert result == "Admin action for admin123"
+        if granted:
+            assert admin_function(user_id="admin123") == "GRANTED"
+        else:
+            with pytest.raises(AuthorizationError):
+                admin_function(user_id="admin123")
+        assert user_client.calls == ["admin123"]
 
-    def test_require_admin_no_client(self) -> None:
-        """Test decorator raises error when no client provided."""
+    def test_require_admin_requires_true(self, spec_client) -> None:
+        """Test a truthy non-True is_admin result does not grant access."""
+        spec_client.is_admin.return_value = "yes"
 
-        @require_admin()
+        @require_admin(client=spec_client)
         def admin_function(user_id: str) -> str:
-            return f"Admin action for {user_id}"
+            return user_id
 
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(AuthorizationError):
             admin_function(user_id="admin123")
 
-        assert "KeyrunesClient not provided" in str(exc_info.value)
-
-    def test_require_admin_no_user_id(self, mock_client) -> None:
-        """Test decorator raises error when user_id not provided."""
-
-        @require_admin(client=mock_client)
-        def admin_function() -> str:
-            return "Admin action"
+    def test_require_admin_user_not_found(self, spec_client) -> None:
+        """Test a missing user is reported as an authorization failure."""
+        spec_client.is_admin.side_effect = UserNotFoundError(
+            "Resource not found."
+        )
+        calls = []
 
-        with pytest.raises(ValueError) as exc_info:
-            admin_function()
+        @require_admin(client=spec_client)
+        def admin_function(user_id: str) -> str:
+            calls.append(user_id)
+            return user_id
 
-        assert "User ID not found" in str(exc_info.value)
+        with pytest.raises(AuthorizationError, match="not found"):
+            admin_function(user_id="ghost123")
 
-    def test_require_admin_custom_user_id_param(self, mock_client) -> None:
-        """Test decorator with custom user_id parameter name."""
-        admin_user = AdminUserFactory()
-        mock_client.get_user = MagicMock(return_value=admin_user)
+        assert calls == []
 
-        @require_admin(client=mock_client, user_id_param="admin_id")
-        def admin_function(admin_id: str) -> str:
-            return f"Admin action for {admin_id}"
+    @pytest.mark.parametrize(
+        "groups, granted", [(["users", "admins"], True), (["users"], False)]
+    )
+    def test_require_admin_token_user_uses_token_groups(
+        self, http_client, http_mock, groups, granted
+    ) -> None:
+        """Test the token subject is judged from its groups, offline."""
+        http_client._token = "test-token"
+        http_client._token_data = {"sub": "user123", "groups": groups}
 
-        result = admin_function(admin_id="admin123")
+        @require_admin(client=http_client)
+        def admin_function(user_id: str) -> str:
+            return "GRANTED"
 
-        assert result == "Admin action for admin123"
+        if granted:
+            assert admin_function(user_id="user123") == "GRANTED"
+        else:
+            with pytest.raises(AuthorizationError):
+                admin_function(user_id="user123")
+        assert http_mock.requests == []
 
-    def test_require_admin_user_id_from_args(self, mock_client) -> None:
-        """Test decorator gets user_id from positional args."""
-        admin_user = AdminUserFactory()
-        mock_client.get_user = MagicMock(return_value=admin_user)
+    @pytest.mark.parametrize("ttl", [0, 60])
+    def test_require_admin_cached_second_call(self, spec_client, ttl) -> None:
+        """Test that a granted admin check is reused within cache_ttl."""
 
-        @require_admin(client=mock_client)
-        def admin_function(user_id: str, action: str) -> str:
-            return f"{action} by {user_id}"
+        @require_admin(client=spec_client, cache_ttl=ttl)
+        def admin_function(user_id: str) -> str:
+            return user_id
 
-        result = admin_function("admin123", "System config")
+        admin_function(user_id="admin123")
+        admin_function(user_id="admin123")
 
-        assert result == "System config by admin123"
+        spec_client.is_admin.assert_called_with("admin123")
+        assert spec_client.is_admin.call_count == (1 if ttl else 2)
 
 
 class TestDecoratorIntegration:
     """Integration tests for decorators."""
 
-    def test_multiple_decorators_combined(self, mock_client) -> None:
+    def test_multiple_decorators_combined(self, spec_client) -> None:
         """Test combining multiple decorators."""
-        admin_user = AdminUserFactory(groups=["admins", "superusers"])
-        mock_client.get_user = MagicMock(return_value=admin_user)
-        mock_client.has_group = MagicMock(return_value=True)
 
-        @require_admin(client=mock_client)
-        @require_group("superusers", client=mock_client)
+        @require_admin(client=spec_client)
+        @require_group("superusers", client=spec_client)
         def super_admin_function(user_id: str) -> str:
             return f"Super admin action for {user_id}"
 
@@ -268,11 +603,10 @@ class TestDecoratorIntegration:
 
         assert result == "Super admin action for admin123"
 
-    def test_decorator_preserves_function_metadata(self, mock_client) -> None:
+    def test_decorator_preserves_function_metadata(self, spec_client) -> None:
         """Test that decorator preserves function name and docstring."""
-        mock_client.has_group = MagicMock(return_value=True)
 
-        @require_group("admins", client=mock_client)
+        @require_group("admins", client=spec_client)
         def my_function(user_id: str) -> str:
             """This is my function docstring."""
             return "result"
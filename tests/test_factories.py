@@ -0,0 +1,17 @@
+"""Tests for the test data factories."""
+
+from tests.factories import make_user
+
+
+class TestUserBuilders:
+    """Tests for the plain user builder."""
+
+    def test_make_user_is_unique_and_overridable(self) -> None:
+        """Test plain user builder produces distinct, overridable users."""
+        first = make_user()
+        second = make_user(username="custom", is_admin=True)
+
+        assert first.id != second.id
+        assert first.email != second.email
+        assert second.username == "custom"
+        assert second.is_admin is True
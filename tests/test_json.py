@@ -0,0 +1,36 @@
+"""Tests for Keyrunes SDK JSON helpers."""
+
+import importlib
+import sys
+from types import ModuleType
+from typing import Iterator
+
+import pytest
+
+from keyrunes_sdk import _json
+
+
+@pytest.fixture
+def stdlib_json(monkeypatch: pytest.MonkeyPatch) -> Iterator[ModuleType]:
+    """Reload the JSON helpers as if orjson were not installed."""
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    yield importlib.reload(_json)
+    monkeypatch.undo()
+    importlib.reload(_json)
+
+
+PAYLOAD = {"identity": "a", "groups": ["users"], "active": True}
+ENCODED = b'{"identity":"a","groups":["users"],"active":true}'
+
+
+def test_round_trip() -> None:
+    """Test the helpers encode compactly and decode what they encode."""
+    assert _json.dumps(PAYLOAD) == ENCODED
+    assert _json.loads(ENCODED) == PAYLOAD
+
+
+def test_stdlib_fallback(stdlib_json: ModuleType) -> None:
+    """Test the json fallback matches when orjson is unavailable."""
+    assert "orjson" not in stdlib_json.dumps.__code__.co_names
+    assert stdlib_json.dumps(PAYLOAD) == ENCODED
+    assert stdlib_json.loads(ENCODED) == PAYLOAD
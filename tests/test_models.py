@@ -14,18 +14,22 @@ from keyrunes_sdk.models import (
 from tests.factories import (
     AdminRegistrationFactory,
     GroupFactory,
-    TokenFactory,
-    UserFactory,
     UserRegistrationFactory,
 )
 
+VALID_REGISTRATION = {
+    "username": "testuser",
+    "email": "test@example.com",
+    "password": "password123",
+}
+
 
 class TestUserModel:
     """Tests for User model."""
 
-    def test_create_user(self) -> None:
+    def test_create_user(self, factory_user: User) -> None:
         """Test creating a user."""
-        user = UserFactory()
+        user = factory_user
 
         assert user.id is not None
         assert user.username is not None
@@ -34,12 +38,9 @@ class TestUserModel:
         assert isinstance(user.is_active, bool)
         assert isinstance(user.is_admin, bool)
 
-    def test_user_with_groups(self) -> None:
+    def test_user_with_groups(self, factory_user: User) -> None:
         """Test user with multiple groups."""
-        user = UserFactory(groups=["admins", "developers", "users"])
-
-        assert len(user.groups) == 3
-        assert "admins" in user.groups
+        assert factory_user.groups == ["admins", "developers", "users"]
 
     def test_user_default_values(self) -> None:
         """Test user default values."""
@@ -79,29 +80,27 @@ class TestGroupModel:
         """Test group with permissions."""
         group = GroupFactory(permissions=["read", "write", "delete"])
 
-        assert len(group.permissions) == 3
-        assert "read" in group.permissions
+        assert group.permissions == ["read", "write", "delete"]
 
 
 class TestTokenModel:
     """Tests for Token model."""
 
-    def test_create_token(self) -> None:
+    def test_create_token(self, factory_token: Token) -> None:
         """Test creating a token."""
-        token = TokenFactory()
+        token = factory_token
 
         assert token.access_token is not None
         assert token.token_type == "bearer"
         assert token.expires_in == 3600
 
-    def test_token_with_user(self) -> None:
+    def test_token_with_user(
+        self, factory_token: Token, factory_user: User
+    ) -> None:
         """Test token with user data."""
-        user = UserFactory()
-        token = TokenFactory(user=user)
-
-        assert token.user is not None
-        assert token.user.id == user.id
-        assert token.user.username == user.username
+        assert factory_token.user is not None
+        assert factory_token.user.id == factory_user.id
+        assert factory_token.user.username == factory_user.username
 
     def test_token_default_type(self) -> None:
         """Test token default type."""
@@ -122,41 +121,21 @@ class TestUserRegistrationModel:
         assert registration.password is not None
         assert len(registration.password) >= 8
 
-    def test_username_min_length(self) -> None:
-        """Test username minimum length validation."""
-        with pytest.raises(ValidationError):
-            UserRegistration(
-                username="ab",
-                email="test@example.com",
-                password="password123",
-            )
-
-    def test_username_max_length(self) -> None:
-        """Test username maximum length validation."""
-        with pytest.raises(ValidationError):
-            UserRegistration(
-                username="a" * 51,
-                email="test@example.com",
-                password="password123",
-            )
-
-    def test_password_min_length(self) -> None:
-        """Test password minimum length validation."""
-        with pytest.raises(ValidationError):
-            UserRegistration(
-                username="testuser",
-                email="test@example.com",
-                password="short",
-            )
+    @pytest.mark.parametrize(
+        "field, value",
+        [
+            pytest.param("username", "ab", id="username-too-short"),
+            pytest.param("username", "a" * 51, id="username-too-long"),
+            pytest.param("password", "short", id="password-too-short"),
+            pytest.param("email", "invalid-email", id="email-invalid"),
+        ],
+    )
+    def test_invalid_field(self, field: str, value: str) -> None:
+        """Test registration field validation rejects invalid values."""
+        data = {**VALID_REGISTRATION, field: value}
 
-    def test_email_validation(self) -> None:
-        """Test email validation in registration."""
         with pytest.raises(ValidationError):
-            UserRegistration(
-                username="testuser",
-                email="invalid-email",
-                password="password123",
-            )
+            UserRegistration.model_validate(data)
 
     def test_registration_with_attributes(self) -> None:
         """Test registration with additional attributes."""
@@ -0,0 +1,68 @@
+"""Tests for Keyrunes SDK package exports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import keyrunes_sdk
+
+
+class TestLazyExports:
+    """Tests for lazily resolved package attributes."""
+
+    def test_all_names_resolve(self) -> None:
+        """Test that every public name can be imported from the package."""
+        for name in keyrunes_sdk.__all__:
+            assert getattr(keyrunes_sdk, name) is not None
+
+    def test_lazy_name_matches_module_attribute(self) -> None:
+        """Test that lazy names are the same objects as in submodules."""
+        from keyrunes_sdk.client import KeyrunesClient
+        from keyrunes_sdk.decorators import require_group
+
+        assert keyrunes_sdk.KeyrunesClient is KeyrunesClient
+        assert keyrunes_sdk.require_group is require_group
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Test that unknown names raise AttributeError."""
+        with pytest.raises(AttributeError):
+            keyrunes_sdk.does_not_exist
+
+    def test_submodules_resolve_as_attributes(self) -> None:
+        """Test that submodules are reachable without importing them."""
+        code = (
+            "import keyrunes_sdk; "
+            "print(keyrunes_sdk.config.__name__, "
+            "keyrunes_sdk.decorators.__name__)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.split() == [
+            "keyrunes_sdk.config",
+            "keyrunes_sdk.decorators",
+        ]
+
+    def test_dir_lists_public_names(self) -> None:
+        """Test that dir() includes lazily imported names."""
+        assert set(keyrunes_sdk.__all__) <= set(dir(keyrunes_sdk))
+
+    def test_import_does_not_load_http_stack(self) -> None:
+        """Test that importing the package defers heavy dependencies."""
+        code = (
+            "import sys, keyrunes_sdk; "
+            "print('httpx' in sys.modules or 'pydantic' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip() == "False"